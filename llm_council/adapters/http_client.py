@@ -0,0 +1,60 @@
+"""Shared HTTP connection pool for the API adapters."""
+
+import asyncio
+from contextlib import asynccontextmanager
+
+import httpx
+
+# Shared client for connection reuse, bound to the event loop that created it.
+# The CLI calls asyncio.run() more than once per process, and an httpx client's
+# pooled connections can't be carried over to a new loop.
+_shared_client: httpx.AsyncClient | None = None
+_shared_client_loop: asyncio.AbstractEventLoop | None = None
+
+# Default request timeout, sized for model queries; other callers pass their own
+DEFAULT_TIMEOUT = 120.0
+
+# How long an idle pooled connection stays open. A debate round ends only when
+# its slowest model finishes, so connections freed by faster models must outlive
+# that wait to be reused (without a new TLS handshake) by the next round.
+KEEPALIVE_EXPIRY = 60.0
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the shared client for the running loop, creating it if needed."""
+    global _shared_client, _shared_client_loop
+    loop = asyncio.get_running_loop()
+    if _shared_client is None or _shared_client.is_closed or _shared_client_loop is not loop:
+        _shared_client = httpx.AsyncClient(
+            timeout=DEFAULT_TIMEOUT,
+            limits=httpx.Limits(
+                max_connections=20,
+                max_keepalive_connections=10,
+                keepalive_expiry=KEEPALIVE_EXPIRY,
+            ),
+        )
+        _shared_client_loop = loop
+    return _shared_client
+
+
+async def get_shared_client() -> httpx.AsyncClient:
+    """Get or create a shared httpx.AsyncClient for connection reuse."""
+    return _get_client()
+
+
+async def close_shared_client():
+    """Close the shared client. Call this when shutting down."""
+    global _shared_client, _shared_client_loop
+    if _shared_client is not None and not _shared_client.is_closed:
+        await _shared_client.aclose()
+    _shared_client = None
+    _shared_client_loop = None
+
+
+@asynccontextmanager
+async def shared_client_context():
+    """Context manager that ensures shared client is closed on exit."""
+    try:
+        yield await get_shared_client()
+    finally:
+        await close_shared_client()
@@ -3,57 +3,59 @@
 import asyncio
 import json
 from collections.abc import AsyncGenerator, Callable
-from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
 from typing import Any
 
-import httpx
+try:
+    import orjson  # pyright: ignore[reportMissingImports]
+except ImportError:  # Optional: faster JSON for request bodies and stream chunks
+    orjson = None
 
 from ..settings import OPENROUTER_API_KEY, OPENROUTER_API_URL
+from .http_client import _get_client
 
-# Shared client for connection reuse
-_shared_client: httpx.AsyncClient | None = None
-_client_lock = asyncio.Lock()
-
-# Default timeout for model queries
-DEFAULT_TIMEOUT = 120.0
-
-
-async def get_shared_client() -> httpx.AsyncClient:
-    """Get or create a shared httpx.AsyncClient for connection reuse."""
-    global _shared_client
-    async with _client_lock:
-        if _shared_client is None or _shared_client.is_closed:
-            _shared_client = httpx.AsyncClient(
-                timeout=DEFAULT_TIMEOUT,
-                limits=httpx.Limits(
-                    max_connections=20,
-                    max_keepalive_connections=10,
-                ),
-            )
-        return _shared_client
 
+@dataclass(slots=True)
+class ModelResponse:
+    """A completed (non-streaming) model response."""
 
-async def close_shared_client():
-    """Close the shared client. Call this when shutting down."""
-    global _shared_client
-    async with _client_lock:
-        if _shared_client is not None and not _shared_client.is_closed:
-            await _shared_client.aclose()
-            _shared_client = None
+    content: str = ""
+    reasoning_details: Any = None
+    tool_calls_made: list[dict[str, Any]] = field(default_factory=list)
 
 
-@asynccontextmanager
-async def shared_client_context():
-    """Context manager that ensures shared client is closed on exit."""
-    try:
-        yield await get_shared_client()
-    finally:
-        await close_shared_client()
+if orjson is not None:
+    _json_loads = orjson.loads
+
+    def _json_dumps_bytes(payload: dict[str, Any]) -> bytes:
+        return orjson.dumps(payload)
+
+else:
+    _json_loads = json.loads
+
+    def _json_dumps_bytes(payload: dict[str, Any]) -> bytes:
+        return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+
+async def _encode_payload(payload: dict[str, Any]) -> bytes:
+    """
+    Serialize a request payload to JSON in a worker thread.
+
+    Debate prompts carry whole transcripts, so encoding them on the event loop
+    would stall the socket reads of every other in-flight model request.
+
+    Args:
+        payload: Request body for the chat completions endpoint
+
+    Returns:
+        UTF-8 encoded JSON body
+    """
+    return await asyncio.to_thread(_json_dumps_bytes, payload)
 
 
 async def query_model(
     model: str, messages: list[dict[str, str]], timeout: float = 120.0
-) -> dict[str, Any] | None:
+) -> ModelResponse | None:
     """
     Query a single model via OpenRouter API.
 
@@ -63,7 +65,7 @@ async def query_model(
         timeout: Request timeout in seconds
 
     Returns:
-        Response dict with 'content' and optional 'reasoning_details', or None if failed
+        ModelResponse with content and reasoning details, or None if failed
     """
     headers = {
         "Authorization": f"Bearer {OPENROUTER_API_KEY}",
@@ -76,17 +78,21 @@ async def query_model(
     }
 
     try:
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.post(OPENROUTER_API_URL, headers=headers, json=payload)
-            response.raise_for_status()
-
-            data = response.json()
-            message = data["choices"][0]["message"]
-
-            return {
-                "content": message.get("content"),
-                "reasoning_details": message.get("reasoning_details"),
-            }
+        response = await _get_client().post(
+            OPENROUTER_API_URL,
+            headers=headers,
+            content=await _encode_payload(payload),
+            timeout=timeout,
+        )
+        response.raise_for_status()
+
+        data = response.json()
+        message = data["choices"][0]["message"]
+
+        return ModelResponse(
+            content=message.get("content") or "",
+            reasoning_details=message.get("reasoning_details"),
+        )
 
     except Exception as e:
         print(f"Error querying model {model}: {e}")
@@ -120,39 +126,44 @@ async def query_model_streaming(
         "stream": True,
     }
 
-    full_content = ""
+    # Token deltas are joined once at the end rather than concatenated per token
+    chunks: list[str] = []
 
     try:
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            async with client.stream(
-                "POST", OPENROUTER_API_URL, headers=headers, json=payload
-            ) as response:
-                response.raise_for_status()
+        client = _get_client()
+        async with client.stream(
+            "POST",
+            OPENROUTER_API_URL,
+            headers=headers,
+            content=await _encode_payload(payload),
+            timeout=timeout,
+        ) as response:
+            response.raise_for_status()
 
-                async for line in response.aiter_lines():
-                    if not line:
-                        continue
-                    if not line.startswith("data: "):
-                        continue
+            async for line in response.aiter_lines():
+                if not line:
+                    continue
+                if not line.startswith("data: "):
+                    continue
 
-                    data_str = line[6:]  # Remove "data: " prefix
+                data_str = line[6:]  # Remove "data: " prefix
 
-                    if data_str == "[DONE]":
-                        break
+                if data_str == "[DONE]":
+                    break
 
-                    try:
-                        data = json.loads(data_str)
-                        delta = data.get("choices", [{}])[0].get("delta", {})
-                        content = delta.get("content", "")
+                try:
+                    data = _json_loads(data_str)
+                    delta = data.get("choices", [{}])[0].get("delta", {})
+                    content = delta.get("content", "")
 
-                        if content:
-                            full_content += content
-                            yield {"type": "token", "content": content}
+                    if content:
+                        chunks.append(content)
+                        yield {"type": "token", "content": content}
 
-                    except json.JSONDecodeError:
-                        continue
+                except json.JSONDecodeError:
+                    continue
 
-        yield {"type": "done", "content": full_content}
+        yield {"type": "done", "content": "".join(chunks)}
 
     except Exception as e:
         yield {"type": "error", "error": str(e)}
@@ -194,142 +205,146 @@ async def query_model_streaming_with_tools(
     full_content = ""
 
     try:
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            for _ in range(max_tool_calls + 1):
-                payload = {
-                    "model": model,
-                    "messages": conversation,
-                    "tools": tools,
-                    "stream": True,
-                }
-
-                current_content = ""
-                tool_calls_buffer = {}  # id -> {name, arguments}
-
-                async with client.stream(
-                    "POST", OPENROUTER_API_URL, headers=headers, json=payload
-                ) as response:
-                    response.raise_for_status()
-
-                    async for line in response.aiter_lines():
-                        if not line:
-                            continue
-                        if not line.startswith("data: "):
-                            continue
-
-                        data_str = line[6:]
-
-                        if data_str == "[DONE]":
-                            break
-
-                        try:
-                            data = json.loads(data_str)
-                            choice = data.get("choices", [{}])[0]
-                            delta = choice.get("delta", {})
-
-                            # Handle content tokens
-                            content = delta.get("content", "")
-                            if content:
-                                current_content += content
-                                yield {"type": "token", "content": content}
-
-                            # Handle tool calls (streamed in chunks)
-                            # NOTE: First chunk has id+name, subsequent chunks have only index+arguments
-                            # Use index as primary key since id is not repeated in subsequent chunks
-                            if "tool_calls" in delta:
-                                for tc in delta["tool_calls"]:
-                                    tc_index = tc.get("index", 0)
-                                    key = f"idx_{tc_index}"
-
-                                    if key not in tool_calls_buffer:
-                                        tool_calls_buffer[key] = {
-                                            "id": None,
-                                            "name": "",
-                                            "arguments": "",
-                                        }
-
-                                    # Capture id from first chunk
-                                    if tc.get("id"):
-                                        tool_calls_buffer[key]["id"] = tc["id"]
-
-                                    if "function" in tc:
-                                        fn = tc["function"]
-                                        if "name" in fn:
-                                            tool_calls_buffer[key]["name"] = fn["name"]
-                                        if "arguments" in fn:
-                                            tool_calls_buffer[key]["arguments"] += fn["arguments"]
-
-                        except json.JSONDecodeError:
-                            continue
-
-                # After stream ends, check if we have tool calls to execute
-                if tool_calls_buffer:
-                    # Build assistant message with tool calls
-                    # Note: content must be string or omitted, not None, for some models
-                    assistant_msg = {"role": "assistant", "tool_calls": []}
-                    if current_content:
-                        assistant_msg["content"] = current_content
-                    tool_results_to_add = []
-
-                    for key, tc_data in tool_calls_buffer.items():
-                        tool_name = tc_data["name"]
-                        try:
-                            tool_args = (
-                                json.loads(tc_data["arguments"]) if tc_data["arguments"] else {}
-                            )
-                        except json.JSONDecodeError:
-                            tool_args = {}
-
-                        tool_call_id = tc_data["id"] or f"call_{key}"
-                        assistant_msg["tool_calls"].append(
-                            {
-                                "id": tool_call_id,
-                                "type": "function",
-                                "function": {"name": tool_name, "arguments": json.dumps(tool_args)},
-                            }
-                        )
-
-                        # Yield tool call event
-                        yield {"type": "tool_call", "tool": tool_name, "args": tool_args}
-
-                        # Execute tool
-                        try:
-                            result = await tool_executor(tool_name, tool_args)
-                            tool_result = str(result) if not isinstance(result, str) else result
-                        except Exception as e:
-                            tool_result = f"Error executing tool: {e}"
-
-                        yield {
-                            "type": "tool_result",
+        client = _get_client()
+        for _ in range(max_tool_calls + 1):
+            payload = {
+                "model": model,
+                "messages": conversation,
+                "tools": tools,
+                "stream": True,
+            }
+
+            content_chunks: list[str] = []
+            tool_calls_buffer = {}  # id -> {name, arguments}
+
+            async with client.stream(
+                "POST",
+                OPENROUTER_API_URL,
+                headers=headers,
+                content=await _encode_payload(payload),
+                timeout=timeout,
+            ) as response:
+                response.raise_for_status()
+
+                async for line in response.aiter_lines():
+                    if not line:
+                        continue
+                    if not line.startswith("data: "):
+                        continue
+
+                    data_str = line[6:]
+
+                    if data_str == "[DONE]":
+                        break
+
+                    try:
+                        data = _json_loads(data_str)
+                        choice = data.get("choices", [{}])[0]
+                        delta = choice.get("delta", {})
+
+                        # Handle content tokens
+                        content = delta.get("content", "")
+                        if content:
+                            content_chunks.append(content)
+                            yield {"type": "token", "content": content}
+
+                        # Handle tool calls (streamed in chunks)
+                        # NOTE: First chunk has id+name, subsequent chunks have only index+arguments
+                        # Use index as primary key since id is not repeated in subsequent chunks
+                        if "tool_calls" in delta:
+                            for tc in delta["tool_calls"]:
+                                tc_index = tc.get("index", 0)
+                                key = f"idx_{tc_index}"
+
+                                if key not in tool_calls_buffer:
+                                    tool_calls_buffer[key] = {
+                                        "id": None,
+                                        "name": "",
+                                        "arguments": "",
+                                    }
+
+                                # Capture id from first chunk
+                                if tc.get("id"):
+                                    tool_calls_buffer[key]["id"] = tc["id"]
+
+                                if "function" in tc:
+                                    fn = tc["function"]
+                                    if "name" in fn:
+                                        tool_calls_buffer[key]["name"] = fn["name"]
+                                    if "arguments" in fn:
+                                        tool_calls_buffer[key]["arguments"] += fn["arguments"]
+
+                    except json.JSONDecodeError:
+                        continue
+
+            current_content = "".join(content_chunks)
+
+            # After stream ends, check if we have tool calls to execute
+            if tool_calls_buffer:
+                # Build assistant message with tool calls
+                # Note: content must be string or omitted, not None, for some models
+                assistant_msg = {"role": "assistant", "tool_calls": []}
+                if current_content:
+                    assistant_msg["content"] = current_content
+                tool_results_to_add = []
+
+                for key, tc_data in tool_calls_buffer.items():
+                    tool_name = tc_data["name"]
+                    try:
+                        tool_args = json.loads(tc_data["arguments"]) if tc_data["arguments"] else {}
+                    except json.JSONDecodeError:
+                        tool_args = {}
+
+                    tool_call_id = tc_data["id"] or f"call_{key}"
+                    assistant_msg["tool_calls"].append(
+                        {
+                            "id": tool_call_id,
+                            "type": "function",
+                            "function": {"name": tool_name, "arguments": json.dumps(tool_args)},
+                        }
+                    )
+
+                    # Yield tool call event
+                    yield {"type": "tool_call", "tool": tool_name, "args": tool_args}
+
+                    # Execute tool
+                    try:
+                        result = await tool_executor(tool_name, tool_args)
+                        tool_result = str(result) if not isinstance(result, str) else result
+                    except Exception as e:
+                        tool_result = f"Error executing tool: {e}"
+
+                    yield {
+                        "type": "tool_result",
+                        "tool": tool_name,
+                        "result": tool_result[:200],
+                    }
+
+                    tool_calls_made.append(
+                        {
                             "tool": tool_name,
-                            "result": tool_result[:200],
+                            "args": tool_args,
+                            "result_preview": tool_result[:200] + "..."
+                            if len(tool_result) > 200
+                            else tool_result,
                         }
+                    )
 
-                        tool_calls_made.append(
-                            {
-                                "tool": tool_name,
-                                "args": tool_args,
-                                "result_preview": tool_result[:200] + "..."
-                                if len(tool_result) > 200
-                                else tool_result,
-                            }
-                        )
-
-                        # Queue tool result to add to conversation
-                        tool_results_to_add.append(
-                            {"role": "tool", "tool_call_id": tool_call_id, "content": tool_result}
-                        )
-
-                    # Add assistant message with all tool calls, then all tool results
-                    conversation.append(assistant_msg)
-                    conversation.extend(tool_results_to_add)
-
-                    # Continue loop to get response after tool execution
-                    continue
+                    # Queue tool result to add to conversation
+                    tool_results_to_add.append(
+                        {"role": "tool", "tool_call_id": tool_call_id, "content": tool_result}
+                    )
+
+                # Add assistant message with all tool calls, then all tool results
+                conversation.append(assistant_msg)
+                conversation.extend(tool_results_to_add)
 
-                # No tool calls - we have the final response
-                full_content = current_content
-                break
+                # Continue loop to get response after tool execution
+                continue
+
+            # No tool calls - we have the final response
+            full_content = current_content
+            break
 
         yield {"type": "done", "content": full_content, "tool_calls_made": tool_calls_made}
 
@@ -344,7 +359,7 @@ async def query_model_with_tools(
     tool_executor: Callable[[str, dict[str, Any]], Any],
     timeout: float = 120.0,
     max_tool_calls: int = 10,
-) -> dict[str, Any] | None:
+) -> ModelResponse | None:
     """
     Query a model with tool calling support.
 
@@ -357,7 +372,7 @@ async def query_model_with_tools(
         max_tool_calls: Maximum number of tool call rounds to prevent infinite loops
 
     Returns:
-        Response dict with 'content', 'tool_calls_made' list, or None if failed
+        ModelResponse with content and the tool_calls_made list, or None if failed
     """
     headers = {
         "Authorization": f"Bearer {OPENROUTER_API_KEY}",
@@ -368,80 +383,85 @@ async def query_model_with_tools(
     conversation = list(messages)
     tool_calls_made = []
 
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        for _ in range(max_tool_calls):
-            payload = {
-                "model": model,
-                "messages": conversation,
-                "tools": tools,
-            }
+    client = _get_client()
+    for _ in range(max_tool_calls):
+        payload = {
+            "model": model,
+            "messages": conversation,
+            "tools": tools,
+        }
+
+        try:
+            response = await client.post(
+                OPENROUTER_API_URL,
+                headers=headers,
+                content=await _encode_payload(payload),
+                timeout=timeout,
+            )
+            response.raise_for_status()
+            data = response.json()
+            message = data["choices"][0]["message"]
 
-            try:
-                response = await client.post(OPENROUTER_API_URL, headers=headers, json=payload)
-                response.raise_for_status()
-                data = response.json()
-                message = data["choices"][0]["message"]
-
-                # Check if model wants to call a tool
-                if message.get("tool_calls"):
-                    # Add assistant message with tool calls
-                    conversation.append(message)
-
-                    # Process each tool call
-                    for tool_call in message["tool_calls"]:
-                        tool_name = tool_call["function"]["name"]
-                        tool_args = json.loads(tool_call["function"]["arguments"])
-
-                        # Execute the tool
-                        try:
-                            result = await tool_executor(tool_name, tool_args)
-                            tool_result = str(result) if not isinstance(result, str) else result
-                        except Exception as e:
-                            tool_result = f"Error executing tool: {e}"
-
-                        tool_calls_made.append(
-                            {
-                                "tool": tool_name,
-                                "args": tool_args,
-                                "result_preview": tool_result[:200] + "..."
-                                if len(tool_result) > 200
-                                else tool_result,
-                            }
-                        )
-
-                        # Add tool result to conversation
-                        conversation.append(
-                            {
-                                "role": "tool",
-                                "tool_call_id": tool_call["id"],
-                                "content": tool_result,
-                            }
-                        )
-
-                    # Continue loop to get next response
-                    continue
+            # Check if model wants to call a tool
+            if message.get("tool_calls"):
+                # Add assistant message with tool calls
+                conversation.append(message)
 
-                # No tool calls - we have the final response
-                return {
-                    "content": message.get("content"),
-                    "reasoning_details": message.get("reasoning_details"),
-                    "tool_calls_made": tool_calls_made,
-                }
+                # Process each tool call
+                for tool_call in message["tool_calls"]:
+                    tool_name = tool_call["function"]["name"]
+                    tool_args = json.loads(tool_call["function"]["arguments"])
 
-            except Exception as e:
-                print(f"Error querying model {model}: {e}")
-                return None
+                    # Execute the tool
+                    try:
+                        result = await tool_executor(tool_name, tool_args)
+                        tool_result = str(result) if not isinstance(result, str) else result
+                    except Exception as e:
+                        tool_result = f"Error executing tool: {e}"
+
+                    tool_calls_made.append(
+                        {
+                            "tool": tool_name,
+                            "args": tool_args,
+                            "result_preview": tool_result[:200] + "..."
+                            if len(tool_result) > 200
+                            else tool_result,
+                        }
+                    )
+
+                    # Add tool result to conversation
+                    conversation.append(
+                        {
+                            "role": "tool",
+                            "tool_call_id": tool_call["id"],
+                            "content": tool_result,
+                        }
+                    )
+
+                # Continue loop to get next response
+                continue
+
+            # No tool calls - we have the final response
+            return ModelResponse(
+                content=message.get("content") or "",
+                reasoning_details=message.get("reasoning_details"),
+                tool_calls_made=tool_calls_made,
+            )
+
+        except Exception as e:
+            print(f"Error querying model {model}: {e}")
+            return None
 
     # Max tool calls reached
-    return {
-        "content": "Max tool calls reached without final response.",
-        "tool_calls_made": tool_calls_made,
-    }
+    return ModelResponse(
+        content="Max tool calls reached without final response.",
+        tool_calls_made=tool_calls_made,
+    )
 
 
 async def query_models_parallel(
     models: list[str], messages: list[dict[str, str]]
-) -> dict[str, dict[str, Any] | None]:
+) -> dict[str, ModelResponse | None]:
     """
     Query multiple models in parallel.
 
@@ -450,7 +470,7 @@ async def query_models_parallel(
         messages: List of message dicts to send to each model
 
     Returns:
-        Dict mapping model identifier to response dict (or None if failed)
+        Dict mapping model identifier to ModelResponse (or None if failed)
     """
     import asyncio
 
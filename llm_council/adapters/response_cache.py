@@ -0,0 +1,90 @@
+"""SQLite-backed cache for completed model responses."""
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Any
+
+from ..settings import RESPONSE_CACHE_ENABLED, RESPONSE_CACHE_PATH, RESPONSE_CACHE_TTL_SECONDS
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    created_at REAL NOT NULL,
+    value TEXT NOT NULL
+)
+"""
+
+
+def cache_key(model: str, prompt: str) -> str:
+    """Hash a (model, prompt) pair into a fixed-size cache key."""
+    return hashlib.blake2b(f"{model}\0{prompt}".encode(), digest_size=32).hexdigest()
+
+
+def _connect() -> sqlite3.Connection:
+    Path(RESPONSE_CACHE_PATH).parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(RESPONSE_CACHE_PATH)
+    conn.execute(_SCHEMA)
+    return conn
+
+
+def _read(key: str) -> dict[str, Any] | None:
+    with closing(_connect()) as conn:
+        row = conn.execute(
+            "SELECT created_at, value FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+    if row is None or time.time() - row[0] > RESPONSE_CACHE_TTL_SECONDS:
+        return None
+    return json.loads(row[1])
+
+
+def _write(key: str, value: dict[str, Any]) -> None:
+    with closing(_connect()) as conn, conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO responses (key, created_at, value) VALUES (?, ?, ?)",
+            (key, time.time(), json.dumps(value)),
+        )
+
+
+async def get_cached_response(model: str, prompt: str) -> dict[str, Any] | None:
+    """
+    Look up a cached response for this model and prompt.
+
+    Args:
+        model: OpenRouter model identifier
+        prompt: The exact prompt sent to the model
+
+    Returns:
+        The stored response dict, or None if caching is disabled, the entry is
+        missing or expired, or the cache can't be read
+    """
+    if not RESPONSE_CACHE_ENABLED:
+        return None
+    try:
+        return await asyncio.to_thread(_read, cache_key(model, prompt))
+    except (sqlite3.Error, OSError, ValueError):
+        return None
+
+
+async def store_response(model: str, prompt: str, response: dict[str, Any]) -> None:
+    """
+    Store a successful response for this model and prompt.
+
+    Cache failures are swallowed — the cache is an optimization, never a
+    reason to fail a query.
+
+    Args:
+        model: OpenRouter model identifier
+        prompt: The exact prompt sent to the model
+        response: JSON-serializable response dict
+    """
+    if not RESPONSE_CACHE_ENABLED:
+        return
+    try:
+        await asyncio.to_thread(_write, cache_key(model, prompt), response)
+    except (sqlite3.Error, OSError, TypeError, ValueError):
+        return
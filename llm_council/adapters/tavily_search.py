@@ -1,9 +1,10 @@
 """Web search functionality using Tavily API."""
 
+import asyncio
 import os
 from typing import Any
 
-import httpx
+from .http_client import get_shared_client
 
 TAVILY_API_KEY = os.getenv("TAVILY_API_KEY")
 TAVILY_API_URL = "https://api.tavily.com/search"
@@ -25,9 +26,24 @@ SEARCH_TOOL = {
 }
 
 
+# Council members often converge on the same query within a round. Identical
+# searches (case and whitespace normalized) on the same event loop — one CLI run
+# or chat session — share a single request, including ones still in flight.
+# Entries are kept in least-recently-used order so a long chat session can't
+# grow the cache without bound.
+SEARCH_CACHE_TTL = 600.0
+SEARCH_CACHE_MAX_ENTRIES = 128
+_search_cache: dict[tuple[str, int], tuple[float, asyncio.Future[dict[str, Any]]]] = {}
+_search_cache_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _normalize_query(query: str) -> str:
+    return " ".join(query.lower().split())
+
+
 async def search_web(query: str, max_results: int = 5) -> dict[str, Any]:
     """
-    Search the web using Tavily API.
+    Search the web using Tavily API, reusing recent identical searches.
 
     Args:
         query: Search query string
@@ -36,6 +52,29 @@ async def search_web(query: str, max_results: int = 5) -> dict[str, Any]:
     Returns:
         Dict with 'results' list containing title, url, and content
     """
+    global _search_cache_loop
+    loop = asyncio.get_running_loop()
+    if _search_cache_loop is not loop:
+        _search_cache.clear()
+        _search_cache_loop = loop
+
+    key = (_normalize_query(query), max_results)
+    entry = _search_cache.pop(key, None)
+    if entry is None or loop.time() - entry[0] > SEARCH_CACHE_TTL:
+        entry = (loop.time(), asyncio.ensure_future(_fetch_search_results(query, max_results)))
+    _search_cache[key] = entry  # (Re)insert as most recently used
+    if len(_search_cache) > SEARCH_CACHE_MAX_ENTRIES:
+        del _search_cache[next(iter(_search_cache))]
+
+    # Shield the shared request so one cancelled caller doesn't cancel it for the rest
+    result = await asyncio.shield(entry[1])
+    if "error" in result and _search_cache.get(key) is entry:
+        del _search_cache[key]  # Let the next caller retry
+    return result
+
+
+async def _fetch_search_results(query: str, max_results: int) -> dict[str, Any]:
+    """Run one Tavily search request."""
     if not TAVILY_API_KEY:
         return {"error": "TAVILY_API_KEY not configured", "results": []}
 
@@ -49,23 +88,24 @@ async def search_web(query: str, max_results: int = 5) -> dict[str, Any]:
     }
 
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(TAVILY_API_URL, json=payload)
-            response.raise_for_status()
-            data = response.json()
-
-            # Format results for LLM consumption
-            results = []
-            for item in data.get("results", []):
-                results.append(
-                    {
-                        "title": item.get("title", ""),
-                        "url": item.get("url", ""),
-                        "content": item.get("content", ""),
-                    }
-                )
-
-            return {"answer": data.get("answer", ""), "results": results}
+        # Reuse the pooled client so repeat searches skip the TLS handshake
+        client = await get_shared_client()
+        response = await client.post(TAVILY_API_URL, json=payload, timeout=30.0)
+        response.raise_for_status()
+        data = response.json()
+
+        # Format results for LLM consumption
+        results = []
+        for item in data.get("results", []):
+            results.append(
+                {
+                    "title": item.get("title", ""),
+                    "url": item.get("url", ""),
+                    "content": item.get("content", ""),
+                }
+            )
+
+        return {"answer": data.get("answer", ""), "results": results}
 
     except Exception as e:
         return {"error": str(e), "results": []}
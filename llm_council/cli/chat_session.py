@@ -23,6 +23,7 @@ from llm_council.cli.presenters import (
     print_chat_banner,
     print_chat_help,
     print_chat_suggestions,
+    print_consensus_synthesis,
     print_history_table,
     print_stage1,
     print_stage2,
@@ -295,13 +296,21 @@ async def run_chat_session(max_turns: int, start_new: bool) -> None:
                 )
                 continue
 
-            # Always run Reflection synthesis for chairman
-            from llm_council.engine import build_chairman_context_debate
+            # Reflection synthesis for chairman, unless the debate already converged
+            from llm_council.engine import build_chairman_context_debate, find_debate_consensus
 
-            context = build_chairman_context_debate(
-                full_query, debate_rounds_data, len(debate_rounds_data)
-            )
-            synthesis = await run_reflection_synthesis(full_query, context)
+            synthesis = find_debate_consensus(debate_rounds_data)
+            if synthesis is not None:
+                print_consensus_synthesis(synthesis)
+            else:
+                # Transcript assembly is CPU-bound; keep the loop free for the title task
+                context = await asyncio.to_thread(
+                    build_chairman_context_debate,
+                    full_query,
+                    debate_rounds_data,
+                    len(debate_rounds_data),
+                )
+                synthesis = await run_reflection_synthesis(full_query, context)
 
             storage.add_debate_message(state.conversation_id, debate_rounds_data, synthesis)
 
@@ -9,14 +9,19 @@ Usage:
 """
 
 import asyncio
+import sys
+from collections.abc import Coroutine
+from typing import Any, TypeVar
 
 import typer
 from rich.markdown import Markdown
 from rich.table import Table
 
+from llm_council.adapters.http_client import close_shared_client
 from llm_council.cli.constants import DEFAULT_CONTEXT_TURNS
 from llm_council.cli.presenters import (
     console,
+    print_consensus_synthesis,
     print_debate_round,
     print_query_header,
     print_stage1,
@@ -38,6 +43,37 @@ app = typer.Typer(
 )
 
 
+def _use_uvloop_if_available() -> None:
+    """Run subsequent asyncio.run() calls on uvloop when it is installed (POSIX only)."""
+    if sys.platform == "win32":
+        return
+    try:
+        import uvloop  # pyright: ignore[reportMissingImports]
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
+@app.callback()
+def _configure_event_loop() -> None:
+    _use_uvloop_if_available()
+
+
+_T = TypeVar("_T")
+
+
+def _run_async(coro: Coroutine[Any, Any, _T]) -> _T:
+    """Run a coroutine on a new event loop, closing that loop's shared HTTP client after."""
+
+    async def _main() -> _T:
+        try:
+            return await coro
+        finally:
+            await close_shared_client()
+
+    return asyncio.run(_main())
+
+
 @app.command()
 def chat(
     max_turns: int = typer.Option(
@@ -57,7 +93,7 @@ def chat(
     """
     from llm_council.cli.chat_session import run_chat_session
 
-    asyncio.run(run_chat_session(max_turns=max_turns, start_new=new))
+    _run_async(run_chat_session(max_turns=max_turns, start_new=new))
 
 
 @app.command()
@@ -93,7 +129,7 @@ def query(
     stream: bool = typer.Option(
         False,
         "--stream",
-        help="Stream token-by-token (sequential, debate mode only)",
+        help="Stream token-by-token (debate mode only)",
     ),
     no_react: bool = typer.Option(
         False,
@@ -125,28 +161,37 @@ def query(
 
     if debate:
         # Run debate mode (rounds only — synthesis always via Reflection)
-        if stream:
-            debate_rounds, _ = asyncio.run(
-                run_debate_streaming(question, rounds, react_enabled=use_react)
-            )
-        else:
-            debate_rounds, _ = asyncio.run(
-                run_debate_parallel(question, rounds, react_enabled=use_react)
-            )
-
-        if debate_rounds is None:
-            raise typer.Exit(1)
-
-        # Show debate rounds (unless simple/final-only)
-        if not simple and not final_only:
-            for round_data in debate_rounds:
-                print_debate_round(round_data, round_data["round_number"])
-
-        # Always run Reflection synthesis for chairman
-        from llm_council.engine import build_chairman_context_debate
-
-        context = build_chairman_context_debate(question, debate_rounds, len(debate_rounds))
-        synthesis = asyncio.run(run_reflection_synthesis(question, context))
+        from llm_council.engine import build_chairman_context_debate, find_debate_consensus
+
+        async def _debate_and_synthesize() -> dict[str, Any]:
+            # One event loop for both, so the chairman request reuses the pooled
+            # connection the last defense round left open (no new TLS handshake)
+            if stream:
+                debate_rounds, _ = await run_debate_streaming(
+                    question, rounds, react_enabled=use_react
+                )
+            else:
+                debate_rounds, _ = await run_debate_parallel(
+                    question, rounds, react_enabled=use_react
+                )
+
+            if debate_rounds is None:
+                raise typer.Exit(1)
+
+            # Show debate rounds (unless simple/final-only)
+            if not simple and not final_only:
+                for round_data in debate_rounds:
+                    print_debate_round(round_data, round_data["round_number"])
+
+            # Reflection synthesis for chairman, unless the debate already converged
+            synthesis = find_debate_consensus(debate_rounds)
+            if synthesis is not None:
+                print_consensus_synthesis(synthesis)
+                return synthesis
+            context = build_chairman_context_debate(question, debate_rounds, len(debate_rounds))
+            return await run_reflection_synthesis(question, context)
+
+        synthesis = _run_async(_debate_and_synthesize())
 
         if simple:
             console.print()
@@ -154,7 +199,7 @@ def query(
 
     else:
         # Run standard council mode (Stages 1-2 only — synthesis always via Reflection)
-        stage1, stage2, metadata = asyncio.run(
+        stage1, stage2, metadata = _run_async(
             run_council_with_progress(question, react_enabled=use_react)
         )
 
@@ -170,7 +215,7 @@ def query(
         from llm_council.engine import build_chairman_context_ranking
 
         context = build_chairman_context_ranking(question, stage1, stage2)
-        stage3 = asyncio.run(run_reflection_synthesis(question, context))
+        stage3 = _run_async(run_reflection_synthesis(question, context))
 
         if simple:
             console.print()
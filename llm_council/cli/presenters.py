@@ -236,6 +236,19 @@ def print_debate_synthesis(synthesis: dict) -> None:
     )
 
 
+def print_consensus_synthesis(synthesis: dict) -> None:
+    """Display the shared answer of a debate that converged without the chairman."""
+    console.print("\n[bold green]━━━ COUNCIL CONSENSUS ━━━[/bold green]\n")
+    console.print(
+        Panel(
+            Markdown(synthesis["response"]),
+            title=f"[bold green]Final Answer • {synthesis['model']}[/bold green]",
+            border_style="green",
+            padding=(1, 2),
+        )
+    )
+
+
 def build_model_panel(
     model: str,
     content: str,
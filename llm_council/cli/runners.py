@@ -225,26 +225,17 @@ async def run_debate_streaming(query: str, cycles: int = 1, react_enabled: bool
                     line_count += 1
                     current_col = 0
 
-    current_round_type = ""
-
-    # Build executor with react_enabled bound
-    executor = functools.partial(_debate_round_streaming, react_enabled=react_enabled)
-
-    # Run debate rounds (no synthesis — handled separately)
-    async for event in _run_debate(query, executor, cycles):
+    # Models stream concurrently; one is shown live while the others are buffered
+    # and replayed, in start order, once the live model finishes.
+    pending_events: dict[str, list[dict]] = {}
+    live_model: str | None = None
+
+    def show_model_event(event: dict) -> None:
+        """Render one model-tagged event for the model currently on screen."""
+        nonlocal current_model, current_content, line_count, current_col
         event_type = event["type"]
 
-        if event_type == "round_start":
-            round_num = event["round_number"]
-            current_round_type = event["round_type"]
-            color, label = type_styles.get(
-                current_round_type, ("white", current_round_type.title())
-            )
-            console.print()
-            console.print(f"[bold {color}]━━━ ROUND {round_num}: {label} ━━━[/bold {color}]")
-            console.print()
-
-        elif event_type == "model_start":
+        if event_type == "model_start":
             current_model = event["model"]
             current_content = ""
             line_count = 0  # Reset - track_output will count actual lines
@@ -319,6 +310,13 @@ async def run_debate_streaming(query: str, cycles: int = 1, react_enabled: bool
             track_output(header)
             console.print(f"[grey62]{short_name}:[/grey62] ", end="")
 
+        elif event_type == "revised_answer_start":
+            # Defense reached its revised answer: mark where it begins
+            console.print()
+            track_output("\n")
+            console.print("[magenta]Revised answer:[/magenta] ", end="")
+            track_output("Revised answer: ")
+
         elif event_type == "model_complete":
             # Clear streaming output
             console.print()  # End the streaming line
@@ -347,7 +345,60 @@ async def run_debate_streaming(query: str, cycles: int = 1, react_enabled: bool
             )
             console.print()
 
+    def promote_next_model() -> None:
+        """Replay buffered models until one is still streaming, and put it on screen."""
+        nonlocal live_model
+        live_model = None
+        while pending_events:
+            model = next(iter(pending_events))
+            backlog = pending_events.pop(model)
+            for buffered in backlog:
+                show_model_event(buffered)
+            if backlog[-1]["type"] not in ("model_complete", "model_error"):
+                live_model = model
+                return
+
+    def handle_model_event(event: dict) -> None:
+        """Show the live model's events immediately; buffer everyone else's."""
+        nonlocal live_model
+        model = event["model"]
+        if live_model is None and event["type"] == "model_start" and not pending_events:
+            live_model = model
+        if model != live_model:
+            pending_events.setdefault(model, []).append(event)
+            return
+        show_model_event(event)
+        if event["type"] in ("model_complete", "model_error"):
+            promote_next_model()
+
+    current_round_type = ""
+
+    # Build executor with react_enabled bound
+    executor = functools.partial(_debate_round_streaming, react_enabled=react_enabled)
+
+    # Run debate rounds (no synthesis — handled separately)
+    async for event in _run_debate(query, executor, cycles):
+        event_type = event["type"]
+
+        if event_type == "round_start":
+            round_num = event["round_number"]
+            current_round_type = event["round_type"]
+            color, label = type_styles.get(
+                current_round_type, ("white", current_round_type.title())
+            )
+            console.print()
+            console.print(f"[bold {color}]━━━ ROUND {round_num}: {label} ━━━[/bold {color}]")
+            console.print()
+
+        elif "model" in event:
+            handle_model_event(event)
+
         elif event_type == "round_complete":
+            # A model can end without a terminal event (e.g. empty response);
+            # close its line and flush whatever is still buffered.
+            while live_model is not None:
+                console.print()
+                promote_next_model()
             rounds_data.append(
                 {
                     "round_number": event["round_number"],
@@ -9,57 +9,105 @@ Public API:
                      generate_conversation_title
     - Debate: ExecuteRound, RoundConfig, build_round_config,
               run_debate, debate_round_parallel, debate_round_streaming
-    - Reflection: synthesize_with_reflection, parse_reflection_output
+    - Reflection: synthesize_with_reflection, find_debate_consensus, parse_reflection_output
     - Council ReAct: council_react_loop
     - Chairman context: build_chairman_context_ranking,
                         build_chairman_context_debate
     - Parsing: parse_ranking_from_text, parse_revised_answer, extract_critiques_for_model,
-               parse_react_output
+               extract_critiques_by_model, parse_react_output
     - Aggregation: calculate_aggregate_rankings
     - Utilities: execute_tool, get_date_context
+
+Names are resolved lazily (PEP 562), so importing the package only loads the
+submodule that backs the name being accessed.
 """
 
-# Aggregation
-from .aggregation import calculate_aggregate_rankings
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .aggregation import calculate_aggregate_rankings
+    from .debate import (
+        ExecuteRound,
+        RoundConfig,
+        build_round_config,
+        debate_round_parallel,
+        debate_round_streaming,
+        run_debate,
+    )
+    from .parsers import (
+        extract_critiques_by_model,
+        extract_critiques_for_model,
+        parse_ranking_from_text,
+        parse_react_output,
+        parse_reflection_output,
+        parse_revised_answer,
+    )
+    from .prompts import (
+        build_chairman_context_debate,
+        build_chairman_context_ranking,
+        get_date_context,
+    )
+    from .ranking import (
+        generate_conversation_title,
+        run_full_council,
+        stage1_collect_responses,
+        stage2_collect_rankings,
+    )
+    from .react import council_react_loop
+    from .reflection import find_debate_consensus, synthesize_with_reflection
+    from .tools import execute_tool
+
+# Public name -> submodule that defines it
+_LAZY_IMPORTS: dict[str, str] = {
+    # Aggregation
+    "calculate_aggregate_rankings": "aggregation",
+    # Debate mode (RoundConfig, async strategies, and orchestration)
+    "ExecuteRound": "debate",
+    "RoundConfig": "debate",
+    "build_round_config": "debate",
+    "debate_round_parallel": "debate",
+    "debate_round_streaming": "debate",
+    "run_debate": "debate",
+    # Parsers
+    "extract_critiques_by_model": "parsers",
+    "extract_critiques_for_model": "parsers",
+    "parse_ranking_from_text": "parsers",
+    "parse_react_output": "parsers",
+    "parse_reflection_output": "parsers",
+    "parse_revised_answer": "parsers",
+    # Prompts (for building chairman context)
+    "build_chairman_context_debate": "prompts",
+    "build_chairman_context_ranking": "prompts",
+    "get_date_context": "prompts",
+    # Ranking mode
+    "generate_conversation_title": "ranking",
+    "run_full_council": "ranking",
+    "stage1_collect_responses": "ranking",
+    "stage2_collect_rankings": "ranking",
+    # Council member ReAct loop
+    "council_react_loop": "react",
+    # Reflection chairman
+    "find_debate_consensus": "reflection",
+    "synthesize_with_reflection": "reflection",
+    # Tool dispatch (both modes)
+    "execute_tool": "tools",
+}
 
-# Debate mode (RoundConfig, async strategies, and orchestration)
-from .debate import (
-    ExecuteRound,
-    RoundConfig,
-    build_round_config,
-    debate_round_parallel,
-    debate_round_streaming,
-    run_debate,
-)
 
-# Parsers
-from .parsers import (
-    extract_critiques_for_model,
-    parse_ranking_from_text,
-    parse_react_output,
-    parse_reflection_output,
-    parse_revised_answer,
-)
+def __getattr__(name: str) -> Any:
+    """Import the submodule backing ``name`` on first access and cache the result."""
+    submodule = _LAZY_IMPORTS.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{submodule}", __name__), name)
+    globals()[name] = value
+    return value
 
-# Prompts (for building chairman context)
-from .prompts import (
-    build_chairman_context_debate,
-    build_chairman_context_ranking,
-    get_date_context,
-)
-from .ranking import (
-    execute_tool,
-    generate_conversation_title,
-    run_full_council,
-    stage1_collect_responses,
-    stage2_collect_rankings,
-)
 
-# Council member ReAct loop
-from .react import council_react_loop
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
 
-# Reflection chairman
-from .reflection import synthesize_with_reflection
 
 __all__ = [
     # Orchestrator
@@ -79,11 +127,13 @@ __all__ = [
     "council_react_loop",
     # Reflection
     "synthesize_with_reflection",
+    "find_debate_consensus",
     "parse_reflection_output",
     # Parsers
     "parse_ranking_from_text",
     "parse_revised_answer",
     "extract_critiques_for_model",
+    "extract_critiques_by_model",
     "parse_react_output",
     # Aggregation
     "calculate_aggregate_rankings",
@@ -6,8 +6,10 @@ and the debate orchestrator.
 """
 
 import asyncio
-from collections.abc import AsyncGenerator, Callable
-from dataclasses import dataclass
+import time
+from collections.abc import AsyncGenerator, AsyncIterator, Callable, Sequence
+from contextlib import aclosing, asynccontextmanager
+from dataclasses import dataclass, field
 from typing import Any, Protocol
 
 from ..adapters.openrouter_client import (
@@ -16,9 +18,15 @@ from ..adapters.openrouter_client import (
     query_model_streaming_with_tools,
     query_model_with_tools,
 )
-from ..adapters.tavily_search import SEARCH_TOOL, format_search_results, search_web
-from ..settings import COUNCIL_MODELS
-from .parsers import extract_critiques_for_model, parse_revised_answer
+from ..adapters.response_cache import get_cached_response, store_response
+from ..adapters.tavily_search import SEARCH_TOOL
+from ..settings import COUNCIL_MODELS, MAX_CONCURRENT_MODELS, MAX_CONCURRENT_PER_PROVIDER
+from .parsers import (
+    RevisedAnswerScanner,
+    extract_critiques_by_model,
+    extract_critiques_for_model,
+    parse_revised_answer,
+)
 from .prompts import (
     build_critique_prompt,
     build_defense_prompt,
@@ -27,6 +35,8 @@ from .prompts import (
     wrap_prompt_with_react,
 )
 from .react import council_react_loop
+from .streaming import TokenCoalescer, await_with_timeout, stream_in_background
+from .tools import execute_tool
 
 
 class ExecuteRound(Protocol):
@@ -37,7 +47,7 @@ class ExecuteRound(Protocol):
 
     Two built-in strategies:
         - ``debate_round_parallel``: runs all models concurrently
-        - ``debate_round_streaming``: runs models sequentially with token streaming
+        - ``debate_round_streaming``: runs models concurrently with token streaming
     """
 
     def __call__(
@@ -49,25 +59,6 @@ class ExecuteRound(Protocol):
     ) -> AsyncGenerator[dict[str, Any], None]: ...
 
 
-async def execute_tool(tool_name: str, tool_args: dict[str, Any]) -> str:
-    """
-    Execute a tool and return the result as a string.
-
-    Args:
-        tool_name: Name of the tool to execute
-        tool_args: Arguments to pass to the tool
-
-    Returns:
-        String result of tool execution
-    """
-    if tool_name == "search_web":
-        query = tool_args.get("query", "")
-        search_response = await search_web(query)
-        return format_search_results(search_response)
-    else:
-        return f"Unknown tool: {tool_name}"
-
-
 @dataclass(frozen=True)
 class RoundConfig:
     """Configuration for a single debate round.
@@ -80,12 +71,95 @@ class RoundConfig:
         build_prompt: A callable (model) -> prompt_string for this round.
         has_revised_answer: Whether the response should be parsed for a revised answer.
         uses_react: Whether council members use text-based ReAct reasoning.
+        prebuilt_messages: Message list shared by every model when the prompt
+            doesn't vary per model, or None to build one from build_prompt.
+        cancels_stragglers: Whether the parallel strategy applies its soft
+            deadline by default. Only the defense round does: a missing initial
+            answer would drop out of critique, defense and the chairman context.
     """
 
     uses_tools: bool
     build_prompt: Callable[[str], str]
     has_revised_answer: bool
     uses_react: bool = False
+    prebuilt_messages: list[dict[str, str]] | None = None
+    cancels_stragglers: bool = False
+
+
+# Prompt builders for RoundConfig.build_prompt. Each is a small slotted callable
+# holding the round's precomputed inputs; per-model prompts are memoized so repeat
+# calls return the cached string instead of re-concatenating the transcript.
+
+
+class _SharedPrompt:
+    """Same prompt for every model (initial round)."""
+
+    __slots__ = ("prompt",)
+
+    def __init__(self, prompt: str) -> None:
+        self.prompt = prompt
+
+    def __call__(self, model: str) -> str:
+        return self.prompt
+
+
+class _CritiquePrompt:
+    """Critique prompt: shared transcript, model name varies."""
+
+    __slots__ = ("user_query", "responses_text", "_cache")
+
+    def __init__(self, user_query: str, responses_text: str) -> None:
+        self.user_query = user_query
+        self.responses_text = responses_text
+        self._cache: dict[str, str] = {}
+
+    def __call__(self, model: str) -> str:
+        prompt = self._cache.get(model)
+        if prompt is None:
+            prompt = build_critique_prompt(self.user_query, self.responses_text, model)
+            self._cache[model] = prompt
+        return prompt
+
+
+class _DefensePrompt:
+    """Defense prompt: the model's own answer plus the critiques aimed at it."""
+
+    __slots__ = (
+        "user_query",
+        "model_to_response",
+        "critiques_by_model",
+        "critique_responses",
+        "use_react",
+        "_cache",
+    )
+
+    def __init__(
+        self,
+        user_query: str,
+        model_to_response: dict[str, str],
+        critiques_by_model: dict[str, str],
+        critique_responses: list[dict[str, Any]],
+        use_react: bool,
+    ) -> None:
+        self.user_query = user_query
+        self.model_to_response = model_to_response
+        self.critiques_by_model = critiques_by_model
+        self.critique_responses = critique_responses
+        self.use_react = use_react
+        self._cache: dict[str, str] = {}
+
+    def __call__(self, model: str) -> str:
+        prompt = self._cache.get(model)
+        if prompt is None:
+            original = self.model_to_response.get(model, "")
+            critiques = self.critiques_by_model.get(model)
+            if critiques is None:
+                critiques = extract_critiques_for_model(model, self.critique_responses)
+            prompt = build_defense_prompt(self.user_query, original, critiques)
+            if self.use_react:
+                prompt = wrap_prompt_with_react(prompt)
+            self._cache[model] = prompt
+        return prompt
 
 
 def build_round_config(
@@ -118,55 +192,67 @@ def build_round_config(
     if round_type == "initial":
         query_with_date = get_date_context() + user_query
         use_react = react_enabled  # initial round supports tools
-
-        def _initial_prompt(_model: str) -> str:
-            prompt = query_with_date
-            if use_react:
-                return wrap_prompt_with_react(prompt)
-            return prompt
+        # Every council member gets the same initial prompt, so build it once
+        initial_prompt = wrap_prompt_with_react(query_with_date) if use_react else query_with_date
 
         return RoundConfig(
             uses_tools=True,
-            build_prompt=_initial_prompt,
+            build_prompt=_SharedPrompt(initial_prompt),
             has_revised_answer=False,
             uses_react=use_react,
+            # The clients never mutate messages (tool loops copy them), so one list serves all
+            prebuilt_messages=[{"role": "user", "content": initial_prompt}],
         )
 
     if round_type == "critique":
         initial_responses = context.get("initial_responses", [])
+        # Shared transcript: formatted once per round, not once per critic
         responses_text = format_responses_for_critique(initial_responses)
 
-        def _critique_prompt(model: str) -> str:
-            return build_critique_prompt(user_query, responses_text, model)
-
         return RoundConfig(
-            uses_tools=False, build_prompt=_critique_prompt, has_revised_answer=False
+            uses_tools=False,
+            build_prompt=_CritiquePrompt(user_query, responses_text),
+            has_revised_answer=False,
         )
 
     if round_type == "defense":
         initial_responses = context.get("initial_responses", [])
         critique_responses = context.get("critique_responses", [])
         model_to_response = {r["model"]: r["response"] for r in initial_responses}
+        # Parse each critique response once and index it by target model,
+        # rather than rescanning every critique for each model's prompt.
+        # Council members without an initial response still get a defense turn.
+        defenders = [*model_to_response, *(m for m in COUNCIL_MODELS if m not in model_to_response)]
+        critiques_by_model = extract_critiques_by_model(defenders, critique_responses)
         use_react = react_enabled  # defense round supports tools
 
-        def _defense_prompt(model: str) -> str:
-            original = model_to_response.get(model, "")
-            critiques = extract_critiques_for_model(model, critique_responses)
-            prompt = build_defense_prompt(user_query, original, critiques)
-            if use_react:
-                return wrap_prompt_with_react(prompt)
-            return prompt
-
         return RoundConfig(
             uses_tools=True,
-            build_prompt=_defense_prompt,
+            build_prompt=_DefensePrompt(
+                user_query, model_to_response, critiques_by_model, critique_responses, use_react
+            ),
             has_revised_answer=True,
             uses_react=use_react,
+            cancels_stragglers=True,
         )
 
     raise ValueError(f"Unknown round type: {round_type}")
 
 
+# Round sequence for the default single critique-defense cycle
+_SINGLE_CYCLE_ROUNDS = ((1, "initial"), (2, "critique"), (3, "defense"))
+
+
+def _round_sequence(cycles: int) -> Sequence[tuple[int, str]]:
+    """Initial round, then ``cycles`` critique-defense pairs (always ends on defense)."""
+    if cycles == 1:
+        return _SINGLE_CYCLE_ROUNDS
+    # Critiques land on even round numbers, defenses on odd ones
+    return [(1, "initial")] + [
+        (n, "critique" if n % 2 == 0 else "defense") for n in range(2, 2 * cycles + 2)
+    ]
+
+
 async def run_debate(
     user_query: str,
     execute_round: ExecuteRound,
@@ -194,32 +280,21 @@ async def run_debate(
         {'type': 'debate_complete', 'rounds': List}
     """
     rounds = []
-
-    # Build the round sequence: initial, then N critique-defense cycles.
-    # Always ends on defense — no dangling critiques.
-    round_sequence = [(1, "initial")]
-    round_num = 2
-    for _ in range(cycles):
-        round_sequence.append((round_num, "critique"))
-        round_num += 1
-        round_sequence.append((round_num, "defense"))
-        round_num += 1
-
-    initial_responses = []
+    # The answers under debate: the initial round's, then each defense's revisions
+    latest_answers: list[dict[str, Any]] = []
     critique_responses = []
-    current_responses = []
 
-    for rnd_num, rnd_type in round_sequence:
+    for rnd_num, rnd_type in _round_sequence(cycles):
         yield {"type": "round_start", "round_number": rnd_num, "round_type": rnd_type}
 
         # Build context for this round
         if rnd_type == "initial":
             context = {}
         elif rnd_type == "critique":
-            context = {"initial_responses": current_responses or initial_responses}
+            context = {"initial_responses": latest_answers}
         elif rnd_type == "defense":
             context = {
-                "initial_responses": current_responses or initial_responses,
+                "initial_responses": latest_answers,
                 "critique_responses": critique_responses,
             }
         else:
@@ -234,46 +309,123 @@ async def run_debate(
         ):
             if event["type"] == "round_complete":
                 responses = event["responses"]
-                # Augment with round metadata
-                yield {
-                    "type": "round_complete",
-                    "round_number": rnd_num,
-                    "round_type": rnd_type,
-                    "responses": responses,
-                }
-            else:
-                yield event
+                # Augment with round metadata (the executor's event is ours to extend)
+                event["round_number"] = rnd_num
+                event["round_type"] = rnd_type
+            yield event
 
         # Track state for subsequent rounds
         rounds.append({"round_number": rnd_num, "round_type": rnd_type, "responses": responses})
 
         if rnd_type == "initial":
-            initial_responses = responses
-            if len(initial_responses) < 2:
+            latest_answers = responses
+            if len(latest_answers) < 2:
                 yield {
                     "type": "error",
                     "message": "Not enough models responded to conduct a debate. Need at least 2 models.",
                 }
                 return
         elif rnd_type == "critique":
+            if not responses:
+                # A defense round with nothing to answer would only waste N calls
+                yield {
+                    "type": "error",
+                    "message": "No critiques were produced, so there is nothing to defend.",
+                }
+                return
             critique_responses = responses
-        elif rnd_type == "defense":
-            current_responses = responses
+        elif rnd_type == "defense" and responses:
+            # If every defense failed, keep debating the last answers that exist
+            latest_answers = responses
 
     yield {"type": "debate_complete", "rounds": rounds}
 
 
+# Smoothed per-model latency (seconds) seen in this process, used to order task
+# spawns. Kept in memory only, so a fresh process starts from council order.
+_LATENCY_EMA_ALPHA = 0.3
+_model_latency: dict[str, float] = {}
+
+
+def _record_latency(model: str, seconds: float) -> None:
+    """Fold one observed network latency into the model's moving average."""
+    previous = _model_latency.get(model)
+    if previous is None:
+        _model_latency[model] = seconds
+    else:
+        _model_latency[model] = previous + _LATENCY_EMA_ALPHA * (seconds - previous)
+
+
+def reset_model_latency() -> None:
+    """Forget observed latencies so spawn order falls back to council order."""
+    _model_latency.clear()
+
+
+def _models_by_latency(slowest_first: bool) -> list[str]:
+    """
+    Council models ordered by observed latency.
+
+    Models with no measurement yet come first, in council order: nothing says a
+    newly added model is fast, so it isn't launched behind every measured one.
+    """
+    unmeasured = [m for m in COUNCIL_MODELS if m not in _model_latency]
+    measured = sorted(
+        (m for m in COUNCIL_MODELS if m in _model_latency),
+        key=_model_latency.__getitem__,
+        reverse=slowest_first,
+    )
+    return unmeasured + measured
+
+
+class _RoundSlots:
+    """
+    Concurrency limits for one round: overall, and per upstream provider.
+
+    Bounds fan-out so a large council, or several models served by the same
+    provider account, doesn't trip rate limits.
+    """
+
+    __slots__ = ("_total", "_providers")
+
+    def __init__(self, models: Sequence[str]) -> None:
+        self._total = asyncio.Semaphore(MAX_CONCURRENT_MODELS)
+        self._providers = {
+            _provider(model): asyncio.Semaphore(MAX_CONCURRENT_PER_PROVIDER) for model in models
+        }
+
+    @asynccontextmanager
+    async def acquire(self, model: str) -> AsyncIterator[None]:
+        """Hold a slot for ``model``.
+
+        The provider slot is taken first, so a task waiting on its provider
+        never sits on one of the overall slots.
+        """
+        async with self._providers[_provider(model)], self._total:
+            yield
+
+
+def _provider(model: str) -> str:
+    """Upstream provider of an OpenRouter model id ("openai/gpt-4o" -> "openai")."""
+    return model.split("/", 1)[0]
+
+
 async def debate_round_parallel(
     round_type: str,
     user_query: str,
     context: dict[str, Any],
     model_timeout: float = 120.0,
     react_enabled: bool = False,
+    min_responses: int | None = None,
+    soft_deadline: float | None = None,
 ) -> AsyncGenerator[dict[str, Any], None]:
     """
     Stream a single debate round, yielding events as each model completes.
 
-    Runs all models in parallel and yields results as they complete.
+    Runs all models in parallel and yields results as they complete. When a
+    soft deadline applies (by default only in the defense round), stragglers
+    are cancelled once ``min_responses`` models have answered and
+    ``soft_deadline`` has passed, so one slow model can't hold up the round.
+    Other rounds wait for every model up to ``model_timeout``.
 
     Args:
         round_type: One of "initial", "critique", or "defense"
@@ -283,6 +435,11 @@ async def debate_round_parallel(
             - For defense: {"initial_responses": [...], "critique_responses": [...]}
         model_timeout: Timeout in seconds for each model (default: 120s)
         react_enabled: Whether council members use text-based ReAct reasoning
+        min_responses: Responses needed before stragglers may be cancelled
+            (default: all but one model, at least 2)
+        soft_deadline: Seconds after round start at which stragglers are
+            cancelled once min_responses is met. None uses 80% of model_timeout
+            in the defense round and disables the soft deadline in other rounds.
 
     Yields:
         {'type': 'model_start', 'model': str}
@@ -293,9 +450,20 @@ async def debate_round_parallel(
     config = build_round_config(round_type, user_query, context, react_enabled=react_enabled)
 
     async def _query_model(model: str) -> dict | None:
-        """Query a single model using the round config."""
+        """Query a single model using the round config, replaying cached answers."""
         prompt = config.build_prompt(model)
+        cached = await get_cached_response(model, prompt)
+        if cached is not None:
+            return cached
+        started = time.monotonic()
+        result = await _fetch_model(model, prompt)
+        if result is not None:
+            _record_latency(model, time.monotonic() - started)
+            await store_response(model, prompt, result)
+        return result
 
+    async def _fetch_model(model: str, prompt: str) -> dict | None:
+        """Query a single model over the network."""
         if config.uses_react:
             # Use text-based ReAct loop — consume events, return final result
             content = ""
@@ -313,7 +481,7 @@ async def debate_round_parallel(
                 result["tool_calls_made"] = tool_calls_made
             return result
 
-        messages = [{"role": "user", "content": prompt}]
+        messages = config.prebuilt_messages or [{"role": "user", "content": prompt}]
 
         if config.uses_tools:
             response = await query_model_with_tools(
@@ -325,46 +493,244 @@ async def debate_round_parallel(
         if response is None:
             return None
 
-        result = {"model": model, "response": response.get("content", "")}
+        result: dict[str, Any] = {"model": model, "response": response.content}
         if config.has_revised_answer:
             result["revised_answer"] = parse_revised_answer(result["response"])
-        if response.get("tool_calls_made"):
-            result["tool_calls_made"] = response["tool_calls_made"]
+        if response.tool_calls_made:
+            result["tool_calls_made"] = response.tool_calls_made
         return result
 
-    # Wrapper to include model identity in result with timeout
-    async def query_with_model(model: str):
+    queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+    slots = _RoundSlots(COUNCIL_MODELS)
+
+    # Each task reports its own outcome as a ready-to-yield event, so no
+    # (model, result, error) plumbing is needed to map completions back to models
+    async def _run(model: str) -> None:
         try:
-            # Apply per-model timeout
-            result = await asyncio.wait_for(_query_model(model), timeout=model_timeout)
-            return model, result, None
+            async with slots.acquire(model):
+                # Apply per-model timeout (time spent waiting for a slot doesn't count)
+                result = await await_with_timeout(_query_model(model), model_timeout)
         except asyncio.TimeoutError:
-            return model, None, f"Timeout after {model_timeout}s"
+            event = {
+                "type": "model_error",
+                "model": model,
+                "error": f"Timeout after {model_timeout}s",
+            }
         except Exception as e:
-            return model, None, str(e)
+            event = {"type": "model_error", "model": model, "error": str(e)}
+        else:
+            if result is None:
+                event = {"type": "model_error", "model": model, "error": "Model returned None"}
+            else:
+                event = {"type": "model_complete", "model": model, "response": result}
+        queue.put_nowait(event)
 
-    # Emit model_start events for all models (so CLI can show spinners)
-    for model in COUNCIL_MODELS:
-        yield {"type": "model_start", "model": model}
+    if soft_deadline is None and config.cancels_stragglers:
+        soft_deadline = model_timeout * 0.8
+    if min_responses is None:
+        min_responses = max(2, len(COUNCIL_MODELS) - 1)
 
-    # Create tasks and map them back to models
-    tasks = {asyncio.create_task(query_with_model(model)): model for model in COUNCIL_MODELS}
+    loop = asyncio.get_running_loop()
+    soft_deadline_at = None if soft_deadline is None else loop.time() + soft_deadline
+    # Slowest first: when concurrency is capped, long requests start earliest
+    tasks = [asyncio.create_task(_run(model)) for model in _models_by_latency(slowest_first=True)]
 
     # Collect responses as they complete
-    responses = []
-
-    for completed_task in asyncio.as_completed(tasks.keys()):
-        model, result, error = await completed_task
-        if error:
-            yield {"type": "model_error", "model": model, "error": error}
-        elif result is None:
-            yield {"type": "model_error", "model": model, "error": "Model returned None"}
+    completed: dict[str, dict[str, Any]] = {}
+    finished: set[str] = set()
+
+    try:
+        # Emit model_start events for all models (so CLI can show spinners).
+        # The tasks already exist, so requests go out as soon as the consumer
+        # awaits rather than after it has rendered every spinner.
+        for model in COUNCIL_MODELS:
+            yield {"type": "model_start", "model": model}
+
+        while len(finished) < len(tasks):
+            if soft_deadline_at is None or len(completed) < min_responses or not queue.empty():
+                event = await queue.get()
+            else:
+                # Quorum reached: only wait for stragglers until the soft deadline
+                try:
+                    event = await await_with_timeout(
+                        queue.get(), max(soft_deadline_at - loop.time(), 0)
+                    )
+                except asyncio.TimeoutError:
+                    for model in COUNCIL_MODELS:
+                        if model not in finished:
+                            yield {
+                                "type": "model_error",
+                                "model": model,
+                                "error": f"Cancelled at soft deadline ({soft_deadline:g}s)",
+                            }
+                    break
+            finished.add(event["model"])
+            if event["type"] == "model_complete":
+                completed[event["model"]] = event["response"]
+            yield event
+    finally:
+        # Don't leave requests running if the consumer stops early
+        for task in tasks:
+            task.cancel()
+
+    # Keep council order so round results (and the next round's prompts)
+    # don't depend on which model finished first
+    responses = [completed[model] for model in COUNCIL_MODELS if model in completed]
+    yield {"type": "round_complete", "responses": responses}
+
+
+# Upstream events forwarded unchanged apart from the model tag
+_PASSTHROUGH_EVENTS = frozenset({"thought", "action", "observation", "tool_call", "tool_result"})
+
+
+@dataclass(slots=True)
+class _ModelAccumulator:
+    """
+    Per-model state while one council member's turn streams in.
+
+    Turns upstream events into the model-tagged events of debate_round_streaming
+    and builds the final response dict once the stream ends.
+    """
+
+    model: str
+    config: RoundConfig
+    tokens: TokenCoalescer = field(default_factory=TokenCoalescer)
+    # Tracks the revised answer as tokens arrive instead of rescanning the full
+    # defense afterwards. ReAct's final answer replaces its streamed text, so it
+    # is parsed after the fact instead.
+    scanner: RevisedAnswerScanner | None = None
+    final_content: str | None = None
+    tool_calls_made: list[dict[str, Any]] = field(default_factory=list)
+    error: str | None = None
+
+    def __post_init__(self) -> None:
+        if self.config.has_revised_answer and not self.config.uses_react:
+            self.scanner = RevisedAnswerScanner()
+
+    def _token_events(self, batch: str | None) -> list[dict[str, Any]]:
+        if not batch:
+            return []
+        events = [{"type": "token", "model": self.model, "content": batch}]
+        if self.scanner is not None and self.scanner.feed(batch):
+            events.append({"type": "revised_answer_start", "model": self.model})
+        return events
+
+    def on_token(self, content: str) -> list[dict[str, Any]]:
+        """Buffer a token; return the events to emit if a batch is due."""
+        return self._token_events(self.tokens.add(content))
+
+    def flush(self) -> list[dict[str, Any]]:
+        """Release any buffered tokens so nothing is held back."""
+        return self._token_events(self.tokens.flush())
+
+    def on_event(self, event: dict[str, Any]) -> dict[str, Any] | None:
+        """Handle a non-token upstream event; return the event to emit, if any."""
+        event_type = event["type"]
+        if event_type in _PASSTHROUGH_EVENTS:
+            if event_type == "tool_call" and self.scanner is not None:
+                # The final answer comes from the turn after the tool call
+                self.scanner.reset()
+            return {**event, "model": self.model}
+        if event_type == "done":
+            self.final_content = event["content"]
+            self.tool_calls_made = event.get("tool_calls_made", [])
+        elif event_type == "error":
+            self.error = event["error"]
+            return {"type": "model_error", "model": self.model, "error": self.error}
+        return None
+
+    def finalize(self) -> dict[str, Any] | None:
+        """Build the response dict, or None if the model failed or said nothing."""
+        # ReAct's final answer replaces the streamed reasoning text
+        full_content = self.final_content if self.final_content is not None else self.tokens.text
+        if not full_content or self.error is not None:
+            return None
+
+        result: dict[str, Any] = {"model": self.model, "response": full_content}
+        if self.config.uses_react:
+            result["reasoned"] = True
+        if self.config.has_revised_answer:
+            revised = self.scanner.revised_answer() if self.scanner is not None else None
+            result["revised_answer"] = (
+                revised if revised is not None else parse_revised_answer(full_content)
+            )
+        if self.tool_calls_made:
+            result["tool_calls_made"] = self.tool_calls_made
+        return result
+
+
+async def _stream_model(model: str, config: RoundConfig) -> AsyncGenerator[dict[str, Any], None]:
+    """
+    Stream one council member's turn for a round, tagging every event with the model.
+
+    Args:
+        model: OpenRouter model identifier
+        config: Round configuration from build_round_config
+
+    Yields:
+        The per-model events of debate_round_streaming, from model_start through
+        model_complete or model_error
+    """
+    yield {"type": "model_start", "model": model}
+
+    prompt = config.build_prompt(model)
+    cached = await get_cached_response(model, prompt)
+    if cached is not None:
+        yield {"type": "token", "model": model, "content": cached["response"]}
+        yield {"type": "model_complete", "model": model, "response": cached}
+        return
+
+    acc = _ModelAccumulator(model, config)
+    started = time.monotonic()
+
+    try:
+        messages = config.prebuilt_messages or [{"role": "user", "content": prompt}]
+        if config.uses_react:
+            # Text-based ReAct loop — pass through thought/action/observation events
+            upstream = council_react_loop(model, prompt)
+        elif config.uses_tools:
+            upstream = query_model_streaming_with_tools(
+                model=model,
+                messages=messages,
+                tools=[SEARCH_TOOL],
+                tool_executor=execute_tool,
+            )
         else:
+            upstream = query_model_streaming(model, messages)
+
+        # Read upstream in a producer task so buffered tokens can be flushed on
+        # time while the model stalls; the stream is closed as soon as we stop
+        async with aclosing(stream_in_background(upstream, tokens=acc.tokens)) as events:
+            async for event in events:
+                if event is None:
+                    for out in acc.flush():
+                        yield out
+                    continue
+                if event["type"] == "token":
+                    for out in acc.on_token(event["content"]):
+                        yield out
+                    continue
+
+                # Anything else ends the current batch so tokens are never held back
+                for out in acc.flush():
+                    yield out
+                out = acc.on_event(event)
+                if out is not None:
+                    yield out
+                if acc.error is not None:
+                    break
+
+        for out in acc.flush():
+            yield out
+
+        result = acc.finalize()
+        if result is not None:
+            _record_latency(model, time.monotonic() - started)
+            await store_response(model, prompt, result)
             yield {"type": "model_complete", "model": model, "response": result}
-            responses.append(result)
 
-    # Yield round complete with all responses
-    yield {"type": "round_complete", "responses": responses}
+    except Exception as e:
+        yield {"type": "model_error", "model": model, "error": str(e)}
 
 
 async def debate_round_streaming(
@@ -372,14 +738,21 @@ async def debate_round_streaming(
     user_query: str,
     context: dict[str, Any],
     react_enabled: bool = False,
+    model_timeout: float = 120.0,
 ) -> AsyncGenerator[dict[str, Any], None]:
     """
-    Execute a single debate round with token-level streaming (sequential).
+    Execute a single debate round with token-level streaming.
 
-    Processes models one at a time, yielding token events as they stream.
+    All council models stream concurrently. Their events are multiplexed through
+    one queue and yielded in arrival order, each tagged with its model, so the
+    round takes as long as the slowest model rather than the sum of all of them.
     Matches the execute-round protocol: yields events and a final
     ``{"type": "round_complete", "responses": [...]}`` event.
 
+    The streaming path never sleeps to pace output: token batching is driven by
+    arrival times alone. If a yield point is ever needed, use
+    ``asyncio.sleep(0)``; a fixed delay caps throughput at one batch per delay.
+
     Args:
         round_type: One of "initial", "critique", or "defense"
         user_query: The user's question
@@ -387,6 +760,9 @@ async def debate_round_streaming(
             - For critique: {"initial_responses": [...]}
             - For defense: {"initial_responses": [...], "critique_responses": [...]}
         react_enabled: Whether council members use text-based ReAct reasoning
+        model_timeout: Deadline in seconds for each model's whole stream
+            (default: 120s). A model still streaming at its deadline is
+            stopped and reported as a model_error.
 
     Yields:
         {'type': 'model_start', 'model': str}
@@ -396,107 +772,53 @@ async def debate_round_streaming(
         {'type': 'observation', 'model': str, 'content': str}
         {'type': 'tool_call', 'model': str, 'tool': str, 'args': dict}
         {'type': 'tool_result', 'model': str, 'tool': str, 'result': str}
+        {'type': 'revised_answer_start', 'model': str} - Defense reached its revised answer
+            (the rest of the model's tokens, up to model_complete, are the revised answer)
         {'type': 'model_complete', 'model': str, 'response': Dict}
         {'type': 'model_error', 'model': str, 'error': str}
         {'type': 'round_complete', 'responses': List}
     """
     config = build_round_config(round_type, user_query, context, react_enabled=react_enabled)
-    tools = [SEARCH_TOOL]
-    responses = []
-
-    for model in COUNCIL_MODELS:
-        yield {"type": "model_start", "model": model}
+    queue: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue()
+    completed: dict[str, dict[str, Any]] = {}
+    slots = _RoundSlots(COUNCIL_MODELS)
 
-        prompt = config.build_prompt(model)
-        full_content = ""
-        tool_calls_made = []
-        had_error = False
+    async def _forward(model: str) -> None:
+        async for event in _stream_model(model, config):
+            if event["type"] == "model_complete":
+                completed[model] = event["response"]
+            queue.put_nowait(event)
 
+    async def _stream_one(model: str) -> None:
         try:
-            if config.uses_react:
-                # Text-based ReAct loop — pass through thought/action/observation events
-                async for event in council_react_loop(model, prompt):
-                    if event["type"] == "token":
-                        full_content += event["content"]
-                        yield {"type": "token", "model": model, "content": event["content"]}
-                    elif event["type"] == "thought":
-                        yield {"type": "thought", "model": model, "content": event["content"]}
-                    elif event["type"] == "action":
-                        yield {
-                            "type": "action",
-                            "model": model,
-                            "tool": event["tool"],
-                            "args": event.get("args"),
-                        }
-                    elif event["type"] == "observation":
-                        yield {
-                            "type": "observation",
-                            "model": model,
-                            "content": event["content"],
-                        }
-                    elif event["type"] == "done":
-                        full_content = event["content"]
-                        tool_calls_made = event.get("tool_calls_made", [])
-                    elif event["type"] == "error":
-                        yield {"type": "model_error", "model": model, "error": event["error"]}
-                        had_error = True
-                        break
-
-            elif config.uses_tools:
-                messages = [{"role": "user", "content": prompt}]
-                async for event in query_model_streaming_with_tools(
-                    model=model,
-                    messages=messages,
-                    tools=tools,
-                    tool_executor=execute_tool,
-                ):
-                    if event["type"] == "token":
-                        full_content += event["content"]
-                        yield {"type": "token", "model": model, "content": event["content"]}
-                    elif event["type"] == "tool_call":
-                        yield {
-                            "type": "tool_call",
-                            "model": model,
-                            "tool": event["tool"],
-                            "args": event["args"],
-                        }
-                    elif event["type"] == "tool_result":
-                        yield {
-                            "type": "tool_result",
-                            "model": model,
-                            "tool": event["tool"],
-                            "result": event["result"],
-                        }
-                    elif event["type"] == "done":
-                        full_content = event.get("content", full_content)
-                        tool_calls_made = event.get("tool_calls_made", [])
-                    elif event["type"] == "error":
-                        yield {"type": "model_error", "model": model, "error": event["error"]}
-                        had_error = True
-                        break
-            else:
-                messages = [{"role": "user", "content": prompt}]
-                async for event in query_model_streaming(model, messages):
-                    if event["type"] == "token":
-                        full_content += event["content"]
-                        yield {"type": "token", "model": model, "content": event["content"]}
-                    elif event["type"] == "error":
-                        yield {"type": "model_error", "model": model, "error": event["error"]}
-                        had_error = True
-                        break
-
-            if full_content and not had_error:
-                result = {"model": model, "response": full_content}
-                if config.uses_react:
-                    result["reasoned"] = True
-                if config.has_revised_answer:
-                    result["revised_answer"] = parse_revised_answer(full_content)
-                if tool_calls_made:
-                    result["tool_calls_made"] = tool_calls_made
-                responses.append(result)
-                yield {"type": "model_complete", "model": model, "response": result}
-
-        except Exception as e:
-            yield {"type": "model_error", "model": model, "error": str(e)}
-
+            async with slots.acquire(model):
+                # A trickling stream never trips the client's read timeout, so
+                # bound the whole turn (time spent waiting for a slot doesn't count)
+                await await_with_timeout(_forward(model), model_timeout)
+        except asyncio.TimeoutError:
+            queue.put_nowait(
+                {"type": "model_error", "model": model, "error": f"Timeout after {model_timeout}s"}
+            )
+        finally:
+            queue.put_nowait(None)  # Sentinel: this model is finished
+
+    # Fastest first: the CLI shows the first model to start live, so the user
+    # sees a complete answer soonest while slower models buffer behind it
+    tasks = [
+        asyncio.create_task(_stream_one(model)) for model in _models_by_latency(slowest_first=False)
+    ]
+    try:
+        remaining = len(tasks)
+        while remaining:
+            event = await queue.get()
+            if event is None:
+                remaining -= 1
+                continue
+            yield event
+    finally:
+        for task in tasks:
+            task.cancel()
+
+    # Keep council order so round results don't depend on which model finished first
+    responses = [completed[model] for model in COUNCIL_MODELS if model in completed]
     yield {"type": "round_complete", "responses": responses}
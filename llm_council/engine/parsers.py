@@ -5,6 +5,11 @@ Handles extraction of rankings, critiques, revised answers, and ReAct output par
 """
 
 import re
+from collections.abc import Iterable, Iterator
+
+# Ranking labels: "1. Response A" in a numbered list, or a bare "Response A"
+_NUMBERED_RANKING_RE = re.compile(r"\d+\.\s*(Response [A-Z])")
+_RESPONSE_LABEL_RE = re.compile(r"Response [A-Z]")
 
 
 def parse_ranking_from_text(ranking_text: str) -> list[str]:
@@ -25,18 +30,19 @@ def parse_ranking_from_text(ranking_text: str) -> list[str]:
             ranking_section = parts[1]
             # Try to extract numbered list format (e.g., "1. Response A")
             # This pattern looks for: number, period, optional space, "Response X"
-            numbered_matches = re.findall(r"\d+\.\s*Response [A-Z]", ranking_section)
+            # (the capture group yields just the "Response X" part)
+            numbered_matches = _NUMBERED_RANKING_RE.findall(ranking_section)
             if numbered_matches:
-                # Extract just the "Response X" part
-                return [re.search(r"Response [A-Z]", m).group() for m in numbered_matches]
+                return numbered_matches
 
             # Fallback: Extract all "Response X" patterns in order
-            matches = re.findall(r"Response [A-Z]", ranking_section)
-            return matches
+            return _RESPONSE_LABEL_RE.findall(ranking_section)
 
     # Fallback: try to find any "Response X" patterns in order
-    matches = re.findall(r"Response [A-Z]", ranking_text)
-    return matches
+    return _RESPONSE_LABEL_RE.findall(ranking_text)
+
+
+_REVISED_HEADER_RE = re.compile(r"##\s*Revised Response\s*\n", re.IGNORECASE)
 
 
 def parse_revised_answer(defense_response: str) -> str:
@@ -50,59 +56,170 @@ def parse_revised_answer(defense_response: str) -> str:
         The revised answer text, or full response if section not found
     """
     # Look for "## Revised Response" section
-    pattern = r"##\s*Revised Response\s*\n(.*)"
-    match = re.search(pattern, defense_response, re.IGNORECASE | re.DOTALL)
+    match = _REVISED_HEADER_RE.search(defense_response)
 
     if match:
-        return match.group(1).strip()
+        return defense_response[match.end() :].strip()
 
     # Fallback: return the full response
     return defense_response
 
 
-def extract_critiques_for_model(target_model: str, critique_responses: list[dict]) -> str:
+class RevisedAnswerScanner:
     """
-    Extract all critiques directed at a specific model.
+    Find the "## Revised Response" section incrementally while a defense streams.
+
+    Only a short tail of already-seen text is rescanned on each chunk, so a
+    header split across chunks is still found without re-traversing the whole
+    response. Once the header is seen, later chunks are collected as-is.
+    """
+
+    __slots__ = ("_tail", "_parts", "found")
+
+    # Longest header text that can straddle a chunk boundary
+    _LOOKBACK = 64
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget everything seen so far (e.g. when a new model turn starts)."""
+        self._tail = ""
+        self._parts: list[str] = []
+        self.found = False
+
+    def feed(self, chunk: str) -> bool:
+        """Consume a chunk; return True on the chunk that completes the header."""
+        if self.found:
+            self._parts.append(chunk)
+            return False
+        window = self._tail + chunk
+        match = _REVISED_HEADER_RE.search(window)
+        if match:
+            self.found = True
+            self._parts.append(window[match.end() :])
+            self._tail = ""
+            return True
+        self._tail = window[-self._LOOKBACK :]
+        return False
+
+    def revised_answer(self) -> str | None:
+        """The revised answer text, or None if the header never appeared."""
+        if not self.found:
+            return None
+        return "".join(self._parts).strip()
+
+
+_SECTION_HEADER_RE = re.compile(r"##([^\n]*)\n")
+_CRITIQUE_HEADER_RE = re.compile(r"#*\s*Critique of", re.IGNORECASE)
+
+_NO_CRITIQUES = "(No specific critiques were extracted for this model)"
+
+
+def _iter_critique_sections(content: str) -> Iterator[tuple[str, bool, str, str]]:
+    """
+    Split a critique response into its ``##`` sections in a single pass.
 
     Args:
-        target_model: The model whose critiques we want to extract
-        critique_responses: All critique responses from round 2
+        content: Full text of one critique response
+
+    Yields:
+        Tuples of (header, is_critique_header, critique_body, section_body) where
+        ``critique_body`` runs to the next "Critique of" header and ``section_body``
+        runs to the next header of any kind.
+    """
+    headers = list(_SECTION_HEADER_RE.finditer(content))
+    is_critique = [bool(_CRITIQUE_HEADER_RE.match(m.group(1))) for m in headers]
+
+    next_critique_start = len(content)
+    sections = []
+    # Walk backwards so each header knows where the next critique header begins
+    for i in range(len(headers) - 1, -1, -1):
+        match = headers[i]
+        next_start = headers[i + 1].start() if i + 1 < len(headers) else len(content)
+        sections.append(
+            (
+                match.group(1).lower(),
+                is_critique[i],
+                content[match.end() : next_critique_start],
+                content[match.end() : next_start],
+            )
+        )
+        if is_critique[i]:
+            next_critique_start = match.start()
+
+    yield from reversed(sections)
+
+
+def _find_critique(sections: list[tuple[str, bool, str, str]], target_name: str) -> str | None:
+    """Return the critique text about ``target_name`` from pre-split sections, if any."""
+    # Prefer a "## Critique of <model>" header
+    for header, is_critique, critique_body, _ in sections:
+        if is_critique and target_name in header:
+            return critique_body.strip()
+
+    # Fallback: any header mentioning the model name
+    for header, _, _, section_body in sections:
+        if target_name in header:
+            return section_body.strip()
+
+    return None
+
+
+def extract_critiques_by_model(
+    target_models: Iterable[str], critique_responses: list[dict]
+) -> dict[str, str]:
+    """
+    Extract the critiques directed at each of several models.
+
+    Each critique response is split into sections once, then every target model
+    is resolved against the parsed sections. Equivalent to calling
+    ``extract_critiques_for_model`` per model without rescanning the text.
+
+    Args:
+        target_models: The models whose critiques we want to extract
+        critique_responses: All critique responses from the critique round
 
     Returns:
-        Concatenated string of all critiques for the target model
+        Dict mapping each target model to its concatenated critiques
     """
-    critiques = []
     # Get just the model name without provider prefix for matching
-    target_name = target_model.split("/")[-1].lower()
+    target_names = {model: model.split("/")[-1].lower() for model in target_models}
+    critiques: dict[str, list[str]] = {model: [] for model in target_names}
 
     for response in critique_responses:
         critic_model = response["model"]
-        # Skip self-critiques (shouldn't exist, but just in case)
-        if critic_model == target_model:
-            continue
+        sections = list(_iter_critique_sections(response["response"]))
+
+        for model, target_name in target_names.items():
+            # Skip self-critiques (shouldn't exist, but just in case)
+            if critic_model == model:
+                continue
 
-        content = response["response"]
+            critique_text = _find_critique(sections, target_name)
+            if critique_text is not None:
+                critiques[model].append(f"**From {critic_model}:**\n{critique_text}")
+
+    return {
+        model: "\n\n".join(found) if found else _NO_CRITIQUES for model, found in critiques.items()
+    }
+
+
+def extract_critiques_for_model(target_model: str, critique_responses: list[dict]) -> str:
+    """
+    Extract all critiques directed at a specific model.
 
-        # Try to extract the section about this model
-        # Look for "## Critique of [model]" pattern
-        pattern = rf"##\s*Critique of\s*[^\n]*{re.escape(target_name)}[^\n]*\n(.*?)(?=##\s*Critique of|\Z)"
-        matches = re.findall(pattern, content, re.IGNORECASE | re.DOTALL)
+    Args:
+        target_model: The model whose critiques we want to extract
+        critique_responses: All critique responses from round 2
 
-        if matches:
-            critique_text = matches[0].strip()
-            critiques.append(f"**From {critic_model}:**\n{critique_text}")
-        else:
-            # Fallback: try matching just the model name in header
-            pattern_simple = rf"##[^\n]*{re.escape(target_name)}[^\n]*\n(.*?)(?=##|\Z)"
-            matches_simple = re.findall(pattern_simple, content, re.IGNORECASE | re.DOTALL)
-            if matches_simple:
-                critique_text = matches_simple[0].strip()
-                critiques.append(f"**From {critic_model}:**\n{critique_text}")
+    Returns:
+        Concatenated string of all critiques for the target model
+    """
+    return extract_critiques_by_model([target_model], critique_responses)[target_model]
 
-    if not critiques:
-        return "(No specific critiques were extracted for this model)"
 
-    return "\n\n".join(critiques)
+_SYNTHESIS_HEADER_RE = re.compile(r"##\s*Synthesis\s*\n", re.IGNORECASE)
 
 
 def parse_reflection_output(text: str) -> tuple[str, str]:
@@ -117,7 +234,7 @@ def parse_reflection_output(text: str) -> tuple[str, str]:
         Tuple of (reflection_text, synthesis_text).
         Falls back to ("", full_text) if the header is not found.
     """
-    match = re.search(r"##\s*Synthesis\s*\n", text, re.IGNORECASE)
+    match = _SYNTHESIS_HEADER_RE.search(text)
     if match:
         reflection = text[: match.start()].strip()
         synthesis = text[match.end() :].strip()
@@ -125,6 +242,17 @@ def parse_reflection_output(text: str) -> tuple[str, str]:
     return "", text
 
 
+_THOUGHT_RE = re.compile(r"Thought:\s*(.+?)(?=\n\s*Action:|$)", re.DOTALL | re.IGNORECASE)
+_ACTION_RE = re.compile(r"Action:\s*(\w+)\s*\(([^)]*)\)", re.IGNORECASE)
+
+# Terminal actions (no args): synthesize() and respond()
+_TERMINAL_ACTIONS = ("synthesize", "respond")
+_TERMINAL_NO_ARG_RE = {
+    terminal: re.compile(rf"Action:\s*{terminal}\s*\(\s*\)", re.IGNORECASE)
+    for terminal in _TERMINAL_ACTIONS
+}
+
+
 def parse_react_output(text: str) -> tuple[str, str, str]:
     """
     Parse ReAct output to extract Thought and Action.
@@ -142,17 +270,12 @@ def parse_react_output(text: str) -> tuple[str, str, str]:
     action_args = None
 
     # Extract Thought section
-    thought_match = re.search(
-        r"Thought:\s*(.+?)(?=\n\s*Action:|$)", text, re.DOTALL | re.IGNORECASE
-    )
+    thought_match = _THOUGHT_RE.search(text)
     if thought_match:
         thought = thought_match.group(1).strip()
 
-    # Terminal actions (no args): synthesize() and respond()
-    _TERMINAL_ACTIONS = {"synthesize", "respond"}
-
     # Extract Action section
-    action_match = re.search(r"Action:\s*(\w+)\s*\(([^)]*)\)", text, re.IGNORECASE)
+    action_match = _ACTION_RE.search(text)
     if action_match:
         action_name = action_match.group(1).lower()
         args = action_match.group(2).strip().strip("\"'")
@@ -166,8 +289,8 @@ def parse_react_output(text: str) -> tuple[str, str, str]:
             action_args = None
     else:
         # Check for terminal actions without args
-        for terminal in _TERMINAL_ACTIONS:
-            if re.search(rf"Action:\s*{terminal}\s*\(\s*\)", text, re.IGNORECASE):
+        for terminal, pattern in _TERMINAL_NO_ARG_RE.items():
+            if pattern.search(text):
                 action = terminal
                 action_args = None
                 break
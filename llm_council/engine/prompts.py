@@ -4,13 +4,20 @@ Prompt templates for council deliberation.
 All prompt construction logic is centralized here for easier maintenance.
 """
 
-from datetime import datetime
+import functools
+from datetime import date
 from typing import Any
 
 
+@functools.lru_cache(maxsize=1)
+def _format_date_context(day: date) -> str:
+    return f"Today's date is {day.strftime('%B %d, %Y')}.\n\n"
+
+
 def get_date_context() -> str:
     """Return current date context to prepend to queries."""
-    return f"Today's date is {datetime.now().strftime('%B %d, %Y')}.\n\n"
+    # Formatted once per day; keyed by date so long chat sessions roll over at midnight
+    return _format_date_context(date.today())
 
 
 def build_ranking_prompt(user_query: str, responses_text: str) -> str:
@@ -71,11 +78,11 @@ def build_chairman_prompt(
         Complete chairman prompt
     """
     stage1_text = "\n\n".join(
-        [f"Model: {result['model']}\nResponse: {result['response']}" for result in stage1_results]
+        f"Model: {result['model']}\nResponse: {result['response']}" for result in stage1_results
     )
 
     stage2_text = "\n\n".join(
-        [f"Model: {result['model']}\nRanking: {result['ranking']}" for result in stage2_results]
+        f"Model: {result['model']}\nRanking: {result['ranking']}" for result in stage2_results
     )
 
     return f"""{get_date_context()}You are the Chairman of an LLM Council. Multiple AI models have provided responses to a user's question, and then ranked each other's responses.
@@ -190,6 +197,25 @@ Format your response as follows:
 [Your updated, improved answer to the original question]"""
 
 
+_ROUND_RULE = "=" * 60
+
+
+def _format_debate_transcript(rounds: list[dict[str, Any]]) -> str:
+    """Render debate rounds as a transcript, one headed block per round."""
+    parts: list[str] = []
+    for round_data in rounds:
+        parts.append(
+            f"\n{_ROUND_RULE}\n"
+            f"ROUND {round_data['round_number']}: {round_data['round_type'].upper()}\n"
+            f"{_ROUND_RULE}"
+        )
+        parts.extend(
+            f"\n**{response['model']}:**\n{response['response']}"
+            for response in round_data["responses"]
+        )
+    return "\n".join(parts)
+
+
 def build_debate_synthesis_prompt(
     user_query: str, rounds: list[dict[str, Any]], num_rounds: int
 ) -> str:
@@ -204,23 +230,7 @@ def build_debate_synthesis_prompt(
     Returns:
         Complete synthesis prompt
     """
-    # Build the debate transcript
-    transcript_parts = []
-
-    for round_data in rounds:
-        round_num = round_data["round_number"]
-        round_type = round_data["round_type"]
-
-        transcript_parts.append(f"\n{'=' * 60}")
-        transcript_parts.append(f"ROUND {round_num}: {round_type.upper()}")
-        transcript_parts.append("=" * 60)
-
-        for response in round_data["responses"]:
-            model = response["model"]
-            content = response["response"]
-            transcript_parts.append(f"\n**{model}:**\n{content}")
-
-    debate_transcript = "\n".join(transcript_parts)
+    debate_transcript = _format_debate_transcript(rounds)
 
     return f"""{get_date_context()}You are the Chairman of an LLM Council. Multiple AI models have participated in a structured debate to answer a user's question. The debate consisted of {num_rounds} rounds:
 
@@ -287,11 +297,11 @@ def build_chairman_context_ranking(
         Formatted context string
     """
     stage1_text = "\n\n".join(
-        [f"Model: {result['model']}\nResponse: {result['response']}" for result in stage1_results]
+        f"Model: {result['model']}\nResponse: {result['response']}" for result in stage1_results
     )
 
     stage2_text = "\n\n".join(
-        [f"Model: {result['model']}\nRanking: {result['ranking']}" for result in stage2_results]
+        f"Model: {result['model']}\nRanking: {result['ranking']}" for result in stage2_results
     )
 
     return f"""Original Question: {user_query}
@@ -317,22 +327,7 @@ def build_chairman_context_debate(
     Returns:
         Formatted context string
     """
-    transcript_parts = []
-
-    for round_data in rounds:
-        round_num = round_data["round_number"]
-        round_type = round_data["round_type"]
-
-        transcript_parts.append(f"\n{'=' * 60}")
-        transcript_parts.append(f"ROUND {round_num}: {round_type.upper()}")
-        transcript_parts.append("=" * 60)
-
-        for response in round_data["responses"]:
-            model = response["model"]
-            content = response["response"]
-            transcript_parts.append(f"\n**{model}:**\n{content}")
-
-    debate_transcript = "\n".join(transcript_parts)
+    debate_transcript = _format_debate_transcript(rounds)
 
     return f"""Original Question: {user_query}
 
@@ -356,7 +351,7 @@ def format_responses_for_critique(initial_responses: list[dict[str, Any]]) -> st
         Formatted string of all responses
     """
     return "\n\n".join(
-        [f"**{result['model']}:**\n{result['response']}" for result in initial_responses]
+        f"**{result['model']}:**\n{result['response']}" for result in initial_responses
     )
 
 
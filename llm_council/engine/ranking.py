@@ -8,7 +8,7 @@ import asyncio
 from typing import Any
 
 from ..adapters.openrouter_client import query_model, query_model_with_tools, query_models_parallel
-from ..adapters.tavily_search import SEARCH_TOOL, format_search_results, search_web
+from ..adapters.tavily_search import SEARCH_TOOL
 from ..settings import COUNCIL_MODELS
 from .aggregation import calculate_aggregate_rankings
 from .parsers import parse_ranking_from_text
@@ -19,25 +19,7 @@ from .prompts import (
     wrap_prompt_with_react,
 )
 from .react import council_react_loop
-
-
-async def execute_tool(tool_name: str, tool_args: dict[str, Any]) -> str:
-    """
-    Execute a tool and return the result as a string.
-
-    Args:
-        tool_name: Name of the tool to execute
-        tool_args: Arguments to pass to the tool
-
-    Returns:
-        String result of tool execution
-    """
-    if tool_name == "search_web":
-        query = tool_args.get("query", "")
-        search_response = await search_web(query)
-        return format_search_results(search_response)
-    else:
-        return f"Unknown tool: {tool_name}"
+from .tools import execute_tool
 
 
 async def stage1_collect_responses(
@@ -100,10 +82,10 @@ async def stage1_collect_responses(
     stage1_results = []
     for model, response in results:
         if response is not None:  # Only include successful responses
-            result = {"model": model, "response": response.get("content", "")}
+            result = {"model": model, "response": response.content}
             # Include tool calls info if any were made
-            if response.get("tool_calls_made"):
-                result["tool_calls_made"] = response["tool_calls_made"]
+            if response.tool_calls_made:
+                result["tool_calls_made"] = response.tool_calls_made
             stage1_results.append(result)
 
     return stage1_results
@@ -132,10 +114,7 @@ async def stage2_collect_rankings(
 
     # Build the responses text for ranking
     responses_text = "\n\n".join(
-        [
-            f"Response {label}:\n{result['response']}"
-            for label, result in zip(labels, stage1_results)
-        ]
+        f"Response {label}:\n{result['response']}" for label, result in zip(labels, stage1_results)
     )
 
     ranking_prompt = build_ranking_prompt(user_query, responses_text)
@@ -148,7 +127,7 @@ async def stage2_collect_rankings(
     stage2_results = []
     for model, response in responses.items():
         if response is not None:
-            full_text = response.get("content", "")
+            full_text = response.content
             parsed = parse_ranking_from_text(full_text)
             stage2_results.append({"model": model, "ranking": full_text, "parsed_ranking": parsed})
 
@@ -205,7 +184,7 @@ async def generate_conversation_title(user_query: str) -> str:
         # Fallback to a generic title
         return "New Conversation"
 
-    title = response.get("content", "New Conversation").strip()
+    title = response.content.strip() or "New Conversation"
 
     # Clean up the title - remove quotes, limit length
     title = title.strip("\"'")
@@ -7,12 +7,19 @@ Contains:
 
 import re
 from collections.abc import AsyncGenerator
+from contextlib import aclosing
 from typing import Any
 
 from ..adapters.openrouter_client import query_model_streaming
 from ..adapters.tavily_search import format_search_results, search_web
 from .parsers import parse_react_output
 
+# Final answer text following a terminal action, keyed by action name
+_TERMINAL_BODY_RE = {
+    action: re.compile(rf"Action:\s*{action}\s*\(\s*\)\s*\n*(.*)", re.DOTALL | re.IGNORECASE)
+    for action in ("respond", "synthesize")
+}
+
 
 async def council_react_loop(
     model: str, prompt: str, max_iterations: int = 3
@@ -42,47 +49,32 @@ async def council_react_loop(
 
     while iteration < max_iterations:
         iteration += 1
-        accumulated_content = ""
-
-        async for event in query_model_streaming(model, messages):
-            if event["type"] == "token":
-                accumulated_content += event["content"]
-                yield {"type": "token", "content": event["content"]}
-            elif event["type"] == "done":
-                accumulated_content = event["content"]
-            elif event["type"] == "error":
-                yield {
-                    "type": "done",
-                    "content": f"Error: {event['error']}",
-                    "tool_calls_made": tool_calls_made,
-                }
-                return
+        chunks: list[str] = []
+
+        async with aclosing(query_model_streaming(model, messages)) as stream:
+            async for event in stream:
+                if event["type"] == "token":
+                    chunks.append(event["content"])
+                    yield {"type": "token", "content": event["content"]}
+                elif event["type"] == "done":
+                    chunks = [event["content"]]
+                elif event["type"] == "error":
+                    yield {
+                        "type": "done",
+                        "content": f"Error: {event['error']}",
+                        "tool_calls_made": tool_calls_made,
+                    }
+                    return
 
+        accumulated_content = "".join(chunks)
         thought, action, action_args = parse_react_output(accumulated_content)
 
         if thought:
             yield {"type": "thought", "content": thought}
 
-        if action == "respond":
-            # Extract response content after "Action: respond()"
-            resp_match = re.search(
-                r"Action:\s*respond\s*\(\s*\)\s*\n*(.*)",
-                accumulated_content,
-                re.DOTALL | re.IGNORECASE,
-            )
-            response_text = resp_match.group(1).strip() if resp_match else accumulated_content
-
-            yield {"type": "action", "tool": "respond", "args": None}
-            yield {"type": "done", "content": response_text, "tool_calls_made": tool_calls_made}
-            return
-
-        elif action == "synthesize":
-            # Also accept synthesize() as terminal (backward compat)
-            resp_match = re.search(
-                r"Action:\s*synthesize\s*\(\s*\)\s*\n*(.*)",
-                accumulated_content,
-                re.DOTALL | re.IGNORECASE,
-            )
+        if action in _TERMINAL_BODY_RE:
+            # synthesize() is also accepted as terminal (backward compat)
+            resp_match = _TERMINAL_BODY_RE[action].search(accumulated_content)
             response_text = resp_match.group(1).strip() if resp_match else accumulated_content
 
             yield {"type": "action", "tool": "respond", "args": None}
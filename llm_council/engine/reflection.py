@@ -2,20 +2,28 @@
 Chairman Reflection synthesis for council deliberation.
 
 The chairman analyses council responses deeply, then produces a final
-synthesis — no tools, no iteration, just focused reasoning.
+synthesis — no tools, no iteration, just focused reasoning. When a debate
+has already converged, the chairman call can be skipped entirely.
 """
 
+import asyncio
+import re
 from collections.abc import AsyncGenerator
+from contextlib import aclosing
+from difflib import SequenceMatcher
+from itertools import combinations
 from typing import Any
 
 from ..adapters.openrouter_client import query_model_streaming
-from ..settings import CHAIRMAN_MODEL
+from ..adapters.response_cache import get_cached_response, store_response
+from ..settings import CHAIRMAN_MODEL, CONSENSUS_THRESHOLD
 from .parsers import parse_reflection_output
 from .prompts import build_reflection_prompt
+from .streaming import TokenCoalescer, stream_in_background
 
 
 async def synthesize_with_reflection(
-    user_query: str, context: str
+    user_query: str, context: str, timeout: float = 180.0
 ) -> AsyncGenerator[dict[str, Any], None]:
     """
     Reflection synthesis for chairman.
@@ -26,29 +34,110 @@ async def synthesize_with_reflection(
     Args:
         user_query: Original user question
         context: Formatted context from ranking or debate mode
+        timeout: Seconds the chairman's stream may take in total; time spent
+            by the caller handling events doesn't count
 
     Yields:
         {'type': 'token', 'content': str} - Streaming tokens
         {'type': 'reflection', 'content': str} - The reflection analysis text
         {'type': 'synthesis', 'response': str, 'model': str} - Final synthesis
     """
-    messages = [{"role": "user", "content": build_reflection_prompt(context)}]
-    accumulated_content = ""
-
-    async for event in query_model_streaming(CHAIRMAN_MODEL, messages):
-        if event["type"] == "token":
-            accumulated_content += event["content"]
-            yield {"type": "token", "content": event["content"]}
-        elif event["type"] == "done":
-            accumulated_content = event["content"]
-        elif event["type"] == "error":
-            yield {
-                "type": "synthesis",
-                "response": f"Error: {event['error']}",
-                "model": CHAIRMAN_MODEL,
-            }
-            return
+    # The context can hold a full debate transcript; build it off the event loop
+    prompt = await asyncio.to_thread(build_reflection_prompt, context)
+    cached = await get_cached_response(CHAIRMAN_MODEL, prompt)
+
+    if cached is not None:
+        accumulated_content = cached["content"]
+        yield {"type": "token", "content": accumulated_content}
+    else:
+        messages = [{"role": "user", "content": prompt}]
+        # Batch tokens so the renderer isn't woken once per token
+        tokens = TokenCoalescer()
+        accumulated_content = ""
+
+        # The producer task reads the stream, so time spent rendering our events
+        # doesn't count against the timeout, and buffered tokens go out on time
+        upstream = stream_in_background(
+            query_model_streaming(CHAIRMAN_MODEL, messages), timeout, tokens
+        )
+
+        async with aclosing(upstream) as stream:
+            async for event in stream:
+                if event is None:
+                    batch = tokens.flush()
+                    if batch:
+                        yield {"type": "token", "content": batch}
+                    continue
+                if event["type"] == "token":
+                    batch = tokens.add(event["content"])
+                    if batch:
+                        yield {"type": "token", "content": batch}
+                    continue
+
+                batch = tokens.flush()
+                if batch:
+                    yield {"type": "token", "content": batch}
+                if event["type"] == "done":
+                    accumulated_content = event["content"]
+                elif event["type"] == "error":
+                    yield {
+                        "type": "synthesis",
+                        "response": f"Error: {event['error']}",
+                        "model": CHAIRMAN_MODEL,
+                    }
+                    return
+
+        batch = tokens.flush()
+        if batch:
+            yield {"type": "token", "content": batch}
+        accumulated_content = accumulated_content or tokens.text
+        if accumulated_content:
+            await store_response(CHAIRMAN_MODEL, prompt, {"content": accumulated_content})
 
     reflection_text, synthesis_text = parse_reflection_output(accumulated_content)
     yield {"type": "reflection", "content": reflection_text}
     yield {"type": "synthesis", "response": synthesis_text, "model": CHAIRMAN_MODEL}
+
+
+def _similarity(a: list[str], b: list[str], threshold: float) -> float:
+    """Word-level similarity ratio, bailing out early on cheap upper bounds."""
+    matcher = SequenceMatcher(None, a, b, autojunk=False)
+    if matcher.real_quick_ratio() < threshold or matcher.quick_ratio() < threshold:
+        return 0.0
+    return matcher.ratio()
+
+
+def find_debate_consensus(
+    rounds: list[dict[str, Any]], threshold: float | None = None
+) -> dict[str, Any] | None:
+    """
+    Return the shared answer if the final defense round converged.
+
+    Compares every pair of revised answers from the last round; if all pairs
+    are at least ``threshold`` similar, the longest answer stands in for the
+    chairman's synthesis.
+
+    Args:
+        rounds: Debate rounds as returned by run_debate
+        threshold: Minimum pairwise similarity (0-1); defaults to the
+            ``consensus_threshold`` setting, where None disables the check
+
+    Returns:
+        {'model': 'consensus', 'response': str} or None if there is no consensus
+    """
+    if threshold is None:
+        threshold = CONSENSUS_THRESHOLD
+    if threshold is None or not rounds or rounds[-1]["round_type"] != "defense":
+        return None
+
+    answers = [r.get("revised_answer") or r["response"] for r in rounds[-1]["responses"]]
+    if len(answers) < 2:
+        return None
+
+    # Compare words only, so case and punctuation differences don't count
+    words = [re.findall(r"\w+", answer.lower()) for answer in answers]
+    for a, b in combinations(words, 2):
+        if _similarity(a, b, threshold) < threshold:
+            return None
+
+    return {"model": "consensus", "response": max(answers, key=len)}
@@ -0,0 +1,145 @@
+"""
+Token stream helpers shared by debate rounds and chairman Reflection.
+"""
+
+import asyncio
+import sys
+import time
+from collections.abc import AsyncGenerator, Awaitable
+from contextlib import aclosing
+from typing import Any, TypeVar
+
+_T = TypeVar("_T")
+
+if sys.version_info >= (3, 11):
+
+    async def await_with_timeout(awaitable: Awaitable[_T], timeout: float) -> _T:
+        """Await with a deadline on the current task (no wrapper task)."""
+        async with asyncio.timeout(timeout):
+            return await awaitable
+
+else:
+
+    async def await_with_timeout(awaitable: Awaitable[_T], timeout: float) -> _T:
+        """Await with a deadline (Python 3.10: asyncio.timeout is unavailable)."""
+        return await asyncio.wait_for(awaitable, timeout=timeout)
+
+
+class TokenCoalescer:
+    """
+    Batch streamed tokens into fewer events.
+
+    The first token goes out immediately so time-to-first-token is unchanged.
+    After that, a batch is released when a token arrives at least ``max_delay``
+    seconds after the previous release, or once ``max_tokens`` have piled up.
+    Callers flush on every non-token event, at end of stream, and when
+    ``due_in`` runs out while the upstream is stalled (see stream_in_background).
+    """
+
+    __slots__ = ("_parts", "_pending", "_last_flush", "max_delay", "max_tokens")
+
+    def __init__(self, max_delay: float = 0.025, max_tokens: int = 16) -> None:
+        self._parts: list[str] = []
+        self._pending = 0
+        self._last_flush: float | None = None
+        self.max_delay = max_delay
+        self.max_tokens = max_tokens
+
+    def add(self, token: str) -> str | None:
+        """Buffer a token; return the batch to emit if one is due."""
+        self._parts.append(token)
+        self._pending += 1
+        if (
+            self._last_flush is None
+            or self._pending >= self.max_tokens
+            or time.monotonic() - self._last_flush >= self.max_delay
+        ):
+            return self.flush()
+        return None
+
+    def flush(self) -> str | None:
+        """Return any buffered tokens as one batch."""
+        if not self._pending:
+            return None
+        batch = "".join(self._parts[-self._pending :])
+        self._pending = 0
+        self._last_flush = time.monotonic()
+        return batch
+
+    def due_in(self) -> float | None:
+        """Seconds until buffered tokens are due, or None if nothing is buffered."""
+        if not self._pending:
+            return None
+        # The first token is always flushed, so _last_flush is set once tokens wait
+        return max(self._last_flush + self.max_delay - time.monotonic(), 0.0)
+
+    @property
+    def text(self) -> str:
+        """Everything received so far, joined once."""
+        return "".join(self._parts)
+
+
+# Queue sentinel: the producer has finished
+_UPSTREAM_DONE = object()
+
+
+async def stream_in_background(
+    upstream: AsyncGenerator[dict[str, Any], None],
+    timeout: float | None = None,
+    tokens: TokenCoalescer | None = None,
+) -> AsyncGenerator[dict[str, Any] | None, None]:
+    """
+    Drain ``upstream`` in a producer task and yield its events from a queue.
+
+    ``timeout`` bounds the upstream stream alone: the producer keeps reading
+    while the caller is busy handling an event, so a slow consumer can't use
+    up the deadline. A stream still running at the deadline is closed and
+    ends with an ``{'type': 'error', 'error': 'Timeout after ...'}`` event.
+    Exceptions raised by ``upstream`` are re-raised to the caller.
+
+    With ``tokens``, yields ``None`` whenever the coalescer's buffered tokens
+    fall due before the next event arrives, so the caller can flush text the
+    model has already sent while the upstream stalls.
+    """
+    queue: asyncio.Queue[Any] = asyncio.Queue()
+
+    async def _drain() -> None:
+        async with aclosing(upstream):
+            async for event in upstream:
+                queue.put_nowait(event)
+
+    async def _produce() -> None:
+        try:
+            if timeout is None:
+                await _drain()
+            else:
+                await await_with_timeout(_drain(), timeout)
+        except asyncio.TimeoutError:
+            queue.put_nowait({"type": "error", "error": f"Timeout after {timeout}s"})
+        except Exception as e:
+            queue.put_nowait(e)
+        finally:
+            queue.put_nowait(_UPSTREAM_DONE)
+
+    producer = asyncio.create_task(_produce())
+    try:
+        while True:
+            due = tokens.due_in() if tokens is not None else None
+            if due is None:
+                item = await queue.get()
+            else:
+                try:
+                    item = await await_with_timeout(queue.get(), due)
+                except asyncio.TimeoutError:
+                    yield None  # Buffered tokens are due
+                    continue
+            if item is _UPSTREAM_DONE:
+                break
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        # Don't leave the upstream request running if the caller stops early,
+        # and wait for it to close so the connection is released right away
+        producer.cancel()
+        await asyncio.wait({producer})
@@ -0,0 +1,29 @@
+"""
+Tool dispatch shared by ranking and debate modes.
+
+Council members in either mode call tools through ``execute_tool``, so
+there is a single place that maps tool names to adapters.
+"""
+
+from typing import Any
+
+from ..adapters.tavily_search import format_search_results, search_web
+
+
+async def execute_tool(tool_name: str, tool_args: dict[str, Any]) -> str:
+    """
+    Execute a tool and return the result as a string.
+
+    Args:
+        tool_name: Name of the tool to execute
+        tool_args: Arguments to pass to the tool
+
+    Returns:
+        String result of tool execution
+    """
+    if tool_name == "search_web":
+        query = tool_args.get("query", "")
+        search_response = await search_web(query)
+        return format_search_results(search_response)
+    else:
+        return f"Unknown tool: {tool_name}"
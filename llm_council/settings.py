@@ -26,6 +26,12 @@ _DEFAULTS = {
     "chairman_model": "openai/gpt-4o-mini",
     "openrouter_api_url": "https://openrouter.ai/api/v1/chat/completions",
     "data_dir": "data/conversations",
+    "max_concurrent_models": 8,
+    "max_concurrent_per_provider": 4,
+    "response_cache_enabled": False,
+    "response_cache_path": "data/response_cache.sqlite3",
+    "response_cache_ttl_seconds": 86400,
+    "consensus_threshold": None,
 }
 
 
@@ -55,3 +61,19 @@ OPENROUTER_API_URL: str = _config["openrouter_api_url"]
 
 # Data directory for conversation storage
 DATA_DIR: str = _config["data_dir"]
+
+# Cap on council model requests in flight at once within a debate round
+MAX_CONCURRENT_MODELS: int = _config["max_concurrent_models"]
+
+# Cap per upstream provider (the "anthropic" in "anthropic/claude-..."), so
+# several models on one account don't trip its rate limit together
+MAX_CONCURRENT_PER_PROVIDER: int = _config["max_concurrent_per_provider"]
+
+# Response cache - replays identical (model, prompt) requests from SQLite (opt-in)
+RESPONSE_CACHE_ENABLED: bool = _config["response_cache_enabled"]
+RESPONSE_CACHE_PATH: str = _config["response_cache_path"]
+RESPONSE_CACHE_TTL_SECONDS: float = _config["response_cache_ttl_seconds"]
+
+# Skip the chairman when every final debate answer is at least this similar
+# (0-1 word-level ratio). None disables the shortcut.
+CONSENSUS_THRESHOLD: float | None = _config["consensus_threshold"]
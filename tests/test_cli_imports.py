@@ -9,3 +9,36 @@ typer = pytest.importorskip("typer")
 
 def test_cli_main_imports():
     import llm_council.cli.main  # noqa: F401
+
+
+def test_engine_package_resolves_all_exports():
+    import llm_council.engine as engine
+
+    for name in engine.__all__:
+        assert getattr(engine, name) is not None
+
+
+def test_engine_package_imports_submodules_lazily():
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, llm_council.engine; "
+        "print(sorted(m for m in sys.modules if m.startswith('llm_council.engine.')))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "[]"
+
+
+def test_uvloop_is_optional(monkeypatch):
+    import asyncio
+    import sys
+
+    from llm_council.cli.main import _use_uvloop_if_available
+
+    monkeypatch.setitem(sys.modules, "uvloop", None)  # makes the import raise ImportError
+    policy = asyncio.get_event_loop_policy()
+    _use_uvloop_if_available()
+    assert asyncio.get_event_loop_policy() is policy
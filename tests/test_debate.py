@@ -9,9 +9,12 @@ import pytest
 
 from llm_council.engine import (
     build_round_config,
+    extract_critiques_by_model,
     extract_critiques_for_model,
     parse_revised_answer,
 )
+from llm_council.engine.parsers import RevisedAnswerScanner
+from tests.conftest import SAMPLE_CRITIQUE_RESPONSES, SAMPLE_MODELS
 
 
 class TestExtractCritiquesForModel:
@@ -106,6 +109,66 @@ Claude's response needs improvement.""",
         assert "needs improvement" in result.lower()
 
 
+class TestExtractCritiquesByModel:
+    """Tests for extract_critiques_by_model (single-pass critique indexing)."""
+
+    def test_matches_per_model_extraction(self):
+        """Each model's entry should equal extract_critiques_for_model's result."""
+        result = extract_critiques_by_model(SAMPLE_MODELS, SAMPLE_CRITIQUE_RESPONSES)
+
+        assert set(result) == set(SAMPLE_MODELS)
+        for model in SAMPLE_MODELS:
+            assert result[model] == extract_critiques_for_model(model, SAMPLE_CRITIQUE_RESPONSES)
+
+    def test_excludes_self_critique(self):
+        """A critic's section about itself should not be attributed to it."""
+        critique_responses = [
+            {
+                "model": "openai/gpt-5.2",
+                "response": """## Critique of openai/gpt-5.2
+This shouldn't be included.
+
+## Critique of google/gemini-3-pro-preview
+Valid critique here.""",
+            },
+        ]
+
+        result = extract_critiques_by_model(
+            ["openai/gpt-5.2", "google/gemini-3-pro-preview"], critique_responses
+        )
+
+        assert "shouldn't be included" not in result["openai/gpt-5.2"]
+        assert "valid critique here" in result["google/gemini-3-pro-preview"].lower()
+
+    def test_critique_section_preferred_over_plain_header(self):
+        """A "Critique of" header wins over another header mentioning the model."""
+        critique_responses = [
+            {
+                "model": "openai/gpt-5.2",
+                "response": """## Notes on gemini-3-pro-preview
+Loose notes.
+
+## Critique of gemini-3-pro-preview
+The real critique.
+## Sources
+Still part of the critique.""",
+            },
+        ]
+
+        result = extract_critiques_by_model(["google/gemini-3-pro-preview"], critique_responses)
+
+        critique = result["google/gemini-3-pro-preview"]
+        assert "The real critique." in critique
+        assert "Still part of the critique." in critique
+        assert "Loose notes." not in critique
+
+    def test_missing_target_gets_placeholder(self):
+        """Models nobody critiqued get the standard placeholder text."""
+        result = extract_critiques_by_model(["x-ai/grok-3"], SAMPLE_CRITIQUE_RESPONSES)
+
+        assert "no specific critiques" in result["x-ai/grok-3"].lower()
+
+
 class TestParseRevisedAnswer:
     """Tests for parse_revised_answer function."""
 
@@ -157,6 +220,52 @@ My answer with whitespace around header."""
         assert "whitespace around header" in result
 
 
+class TestRevisedAnswerScanner:
+    """Tests for incremental revised-answer detection."""
+
+    DEFENSE = "## Addressing Critiques\nFair point.\n\n## Revised Response\nBetter answer.\nMore."
+
+    def test_matches_parse_revised_answer_across_chunk_boundaries(self):
+        """Header split across any chunk boundary yields the same answer."""
+        expected = parse_revised_answer(self.DEFENSE)
+        for size in (1, 2, 5, 13, len(self.DEFENSE)):
+            scanner = RevisedAnswerScanner()
+            started = [
+                scanner.feed(self.DEFENSE[i : i + size]) for i in range(0, len(self.DEFENSE), size)
+            ]
+            assert started.count(True) == 1
+            assert scanner.revised_answer() == expected
+
+    def test_missing_header_returns_none(self):
+        """No header means the caller falls back to parse_revised_answer."""
+        scanner = RevisedAnswerScanner()
+        scanner.feed("## Addressing Critiques\nNo revision here.")
+        assert scanner.revised_answer() is None
+
+
+class TestGetDateContext:
+    """Tests for the memoized date context."""
+
+    def test_rolls_over_to_the_new_day(self):
+        """The cached context follows the current date."""
+        from datetime import date
+        from unittest.mock import patch
+
+        from llm_council.engine import prompts
+
+        class FakeDate(date):
+            today_value = date(2026, 1, 31)
+
+            @classmethod
+            def today(cls):
+                return cls.today_value
+
+        with patch.object(prompts, "date", FakeDate):
+            assert "January 31, 2026" in prompts.get_date_context()
+            FakeDate.today_value = date(2026, 2, 1)
+            assert "February 01, 2026" in prompts.get_date_context()
+
+
 class TestDebateDataStructures:
     """Tests for debate mode data structures and storage format."""
 
@@ -233,6 +342,25 @@ class TestBuildRoundConfig:
         assert "model/b" in prompt_b
         assert prompt_a != prompt_b
 
+    def test_prompts_are_built_once_per_model(self):
+        """Repeat build_prompt calls for a model return the same cached string."""
+        context = {
+            "initial_responses": [{"model": "test/m", "response": "answer"}],
+            "critique_responses": [{"model": "test/m2", "response": "critique"}],
+        }
+        for round_type in ("initial", "critique", "defense"):
+            config = build_round_config(round_type, "Q?", context)
+            assert config.build_prompt("test/m") is config.build_prompt("test/m")
+
+    def test_initial_round_shares_prebuilt_messages(self):
+        """Initial round prebuilds one message list matching the shared prompt."""
+        config = build_round_config("initial", "Q?", {})
+        assert config.prebuilt_messages == [
+            {"role": "user", "content": config.build_prompt("test/m")}
+        ]
+        critique = build_round_config("critique", "Q?", {"initial_responses": []})
+        assert critique.prebuilt_messages is None
+
     def test_defense_prompt_includes_critiques(self):
         """Defense prompt should include critique content for the model."""
         context = {
@@ -105,6 +105,29 @@ class TestReflectionLoop:
         assert "Python is the best" in synthesis_event["response"]
         assert "model" in synthesis_event
 
+    @pytest.mark.asyncio
+    async def test_tokens_are_batched(self):
+        """A burst of tokens reaches the caller as fewer, larger token events."""
+        from llm_council.engine.reflection import synthesize_with_reflection
+
+        words = [f"{word} " for word in REFLECTION_FULL.split(" ")]
+
+        async def mock_generator():
+            for word in words:
+                yield {"type": "token", "content": word}
+            yield {"type": "done", "content": "".join(words)}
+
+        with patch(
+            "llm_council.engine.reflection.query_model_streaming",
+            return_value=mock_generator(),
+        ):
+            events = [e async for e in synthesize_with_reflection("test query", "test context")]
+
+        tokens = [e["content"] for e in events if e["type"] == "token"]
+        assert tokens[0] == words[0]  # First token isn't held back
+        assert len(tokens) < len(words)
+        assert "".join(tokens) == "".join(words)
+
     @pytest.mark.asyncio
     async def test_error_yields_synthesis_with_error(self):
         """On streaming error, should yield synthesis with error message."""
@@ -125,6 +148,118 @@ class TestReflectionLoop:
         assert events[0]["type"] == "synthesis"
         assert "Error" in events[0]["response"]
 
+    @pytest.mark.asyncio
+    async def test_error_closes_upstream_stream(self):
+        """The chairman's stream is closed as soon as it reports an error."""
+        from llm_council.engine.reflection import synthesize_with_reflection
+
+        closed = []
+
+        async def mock_generator():
+            try:
+                yield {"type": "error", "error": "Connection failed"}
+                yield {"type": "token", "content": "never read"}
+            finally:
+                closed.append(True)
+
+        with patch(
+            "llm_council.engine.reflection.query_model_streaming",
+            return_value=mock_generator(),
+        ):
+            events = [e async for e in synthesize_with_reflection("test query", "test context")]
+            # Closed on return, not left for the event loop's async-generator finalizer
+            assert closed == [True]
+
+        assert [e["type"] for e in events] == ["synthesis"]
+
+    @pytest.mark.asyncio
+    async def test_trickling_stream_times_out(self):
+        """A chairman stream still sending tokens at the timeout ends in an error synthesis."""
+        import asyncio
+
+        from llm_council.engine.reflection import synthesize_with_reflection
+
+        closed = []
+
+        async def mock_generator():
+            try:
+                while True:  # Keeps sending tokens, never finishes
+                    yield {"type": "token", "content": "."}
+                    await asyncio.sleep(0.01)
+            finally:
+                closed.append(True)
+
+        with patch(
+            "llm_council.engine.reflection.query_model_streaming",
+            return_value=mock_generator(),
+        ):
+            events = [
+                e
+                async for e in synthesize_with_reflection("test query", "test context", timeout=0.1)
+            ]
+
+        assert closed == [True]
+        assert events[-1]["type"] == "synthesis"
+        assert "Timeout" in events[-1]["response"]
+        assert not any(e["type"] == "reflection" for e in events)
+
+    @pytest.mark.asyncio
+    async def test_slow_consumer_does_not_use_up_the_timeout(self):
+        """Time the caller spends handling events doesn't count toward the timeout."""
+        import asyncio
+
+        from llm_council.engine.reflection import synthesize_with_reflection
+
+        async def mock_generator():
+            for word in ("Analysis. ", "## Synthesis\n", "Answer."):
+                await asyncio.sleep(0.02)
+                yield {"type": "token", "content": word}
+            yield {"type": "done", "content": "Analysis. ## Synthesis\nAnswer."}
+
+        with patch(
+            "llm_council.engine.reflection.query_model_streaming",
+            return_value=mock_generator(),
+        ):
+            events = []
+            async for event in synthesize_with_reflection(
+                "test query", "test context", timeout=0.2
+            ):
+                events.append(event)
+                await asyncio.sleep(0.1)  # Slow rendering
+
+        assert events[-1] == {
+            "type": "synthesis",
+            "response": "Answer.",
+            "model": events[-1]["model"],
+        }
+
+    @pytest.mark.asyncio
+    async def test_buffered_tokens_are_flushed_while_the_chairman_stalls(self):
+        """Tokens held for batching reach the caller within the window, not after a stall."""
+        import asyncio
+        import time
+
+        from llm_council.engine.reflection import synthesize_with_reflection
+
+        async def mock_generator():
+            yield {"type": "token", "content": "Analysis"}
+            yield {"type": "token", "content": " continues"}  # Buffered behind the first
+            await asyncio.sleep(0.5)
+            yield {"type": "done", "content": "Analysis continues"}
+
+        started = time.monotonic()
+        arrivals = []
+        with patch(
+            "llm_council.engine.reflection.query_model_streaming",
+            return_value=mock_generator(),
+        ):
+            async for event in synthesize_with_reflection("test query", "test context"):
+                if event["type"] == "token":
+                    arrivals.append((event["content"], time.monotonic() - started))
+
+        assert [content for content, _ in arrivals] == ["Analysis", " continues"]
+        assert arrivals[1][1] < 0.1
+
     @pytest.mark.asyncio
     async def test_no_header_still_yields_synthesis(self):
         """When model omits ## Synthesis header, full text becomes synthesis."""
@@ -143,3 +278,58 @@ class TestReflectionLoop:
 
         synthesis_event = next(e for e in events if e["type"] == "synthesis")
         assert "Python is the best" in synthesis_event["response"]
+
+
+# =============================================================================
+# Tests: Debate consensus shortcut
+# =============================================================================
+
+
+def _defense_rounds(*answers: str) -> list[dict]:
+    return [
+        {
+            "round_number": 3,
+            "round_type": "defense",
+            "responses": [
+                {
+                    "model": f"test/m{i}",
+                    "response": f"## Revised Response\n{a}",
+                    "revised_answer": a,
+                }
+                for i, a in enumerate(answers)
+            ],
+        }
+    ]
+
+
+class TestFindDebateConsensus:
+    """Tests for skipping the chairman when the debate converged."""
+
+    def test_converged_answers_return_longest(self):
+        from llm_council.engine import find_debate_consensus
+
+        rounds = _defense_rounds(
+            "Python is the best first language for most beginners.",
+            "Python is the best first language for most beginners today.",
+        )
+        result = find_debate_consensus(rounds, threshold=0.9)
+        assert result == {
+            "model": "consensus",
+            "response": "Python is the best first language for most beginners today.",
+        }
+
+    def test_divergent_answers_need_chairman(self):
+        from llm_council.engine import find_debate_consensus
+
+        rounds = _defense_rounds(
+            "Python is the best first language.",
+            "JavaScript wins because it runs in every browser.",
+        )
+        assert find_debate_consensus(rounds, threshold=0.9) is None
+
+    def test_disabled_by_default(self):
+        from llm_council.engine import find_debate_consensus
+
+        rounds = _defense_rounds("Same answer.", "Same answer.")
+        with patch("llm_council.engine.reflection.CONSENSUS_THRESHOLD", None):
+            assert find_debate_consensus(rounds) is None
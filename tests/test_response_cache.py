@@ -0,0 +1,75 @@
+"""
+Tests for the opt-in SQLite response cache.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from llm_council.adapters import response_cache
+from llm_council.adapters.openrouter_client import ModelResponse
+from llm_council.adapters.response_cache import get_cached_response, store_response
+from tests.conftest import SAMPLE_MODELS
+
+
+@pytest.fixture
+def enabled_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(response_cache, "RESPONSE_CACHE_ENABLED", True)
+    monkeypatch.setattr(response_cache, "RESPONSE_CACHE_PATH", str(tmp_path / "cache.sqlite3"))
+    monkeypatch.setattr(response_cache, "RESPONSE_CACHE_TTL_SECONDS", 60)
+
+
+class TestResponseCache:
+    @pytest.mark.asyncio
+    async def test_round_trip(self, enabled_cache):
+        await store_response("test/model", "prompt", {"response": "cached answer"})
+        assert await get_cached_response("test/model", "prompt") == {"response": "cached answer"}
+
+    @pytest.mark.asyncio
+    async def test_keyed_by_model_and_prompt(self, enabled_cache):
+        await store_response("test/model", "prompt", {"response": "cached answer"})
+        assert await get_cached_response("other/model", "prompt") is None
+        assert await get_cached_response("test/model", "other prompt") is None
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_ignored(self, enabled_cache, monkeypatch):
+        await store_response("test/model", "prompt", {"response": "cached answer"})
+        monkeypatch.setattr(response_cache, "RESPONSE_CACHE_TTL_SECONDS", -1)
+        assert await get_cached_response("test/model", "prompt") is None
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(response_cache, "RESPONSE_CACHE_PATH", str(tmp_path / "cache.sqlite3"))
+        await store_response("test/model", "prompt", {"response": "cached answer"})
+        assert await get_cached_response("test/model", "prompt") is None
+        assert not (tmp_path / "cache.sqlite3").exists()
+
+
+@pytest.mark.asyncio
+async def test_repeated_round_is_served_from_cache(enabled_cache):
+    """A second identical debate round makes no model calls."""
+    from llm_council.engine.debate import debate_round_parallel
+
+    calls = []
+
+    async def mock_query(model, messages, *args, **kwargs):
+        calls.append(model)
+        return ModelResponse(content=f"Response from {model}")
+
+    async def run_round():
+        return [
+            event
+            async for event in debate_round_parallel(
+                round_type="critique",
+                user_query="Q?",
+                context={"initial_responses": [{"model": "m", "response": "r"}]},
+            )
+        ]
+
+    with patch("llm_council.engine.debate.query_model", side_effect=mock_query):
+        with patch("llm_council.engine.debate.COUNCIL_MODELS", SAMPLE_MODELS):
+            first = await run_round()
+            second = await run_round()
+
+    assert sorted(calls) == sorted(SAMPLE_MODELS)
+    assert first[-1]["responses"] and len(second[-1]["responses"]) == len(SAMPLE_MODELS)
@@ -0,0 +1,206 @@
+"""
+Tests for the streaming debate display in CLI runners.
+
+Models stream concurrently, but run_debate_streaming shows one model live
+and buffers the others, replaying them in start order. The engine is mocked
+with a scripted event sequence and the console records what gets printed.
+"""
+
+from unittest.mock import patch
+
+import pytest
+from rich.panel import Panel
+
+MODELS = ["test/alpha", "test/beta", "test/gamma"]
+NAMES = [model.split("/")[-1] for model in MODELS]
+
+
+class RecordingConsole:
+    """Stands in for the Rich console, keeping each printed item as plain text."""
+
+    def __init__(self):
+        self.items: list[str] = []
+
+    def print(self, *objects, **kwargs):
+        for obj in objects:
+            if isinstance(obj, Panel):
+                self.items.append(f"{obj.title} {obj.renderable}")
+            else:
+                self.items.append(str(obj))
+
+
+def _panel_stub(model, content, **kwargs):
+    return f"PANEL {model.split('/')[-1]}: {content}"
+
+
+def _owner(item: str) -> str | None:
+    """Model whose output this printed item belongs to (None for spacing/headers)."""
+    owners = [name for name in NAMES if name in item]
+    assert len(owners) <= 1, item
+    return owners[0] if owners else None
+
+
+def _owner_runs(items: list[str]) -> list[str]:
+    """Collapse printed items into runs of consecutive output per model."""
+    runs: list[str] = []
+    for item in items:
+        owner = _owner(item)
+        if owner and (not runs or runs[-1] != owner):
+            runs.append(owner)
+    return runs
+
+
+def _round(events: list[dict], responses: list[dict] | None = None) -> list[dict]:
+    """Wrap model events in round_start / round_complete / debate_complete."""
+    rnd = {"round_number": 1, "round_type": "initial", "responses": responses or []}
+    return [
+        {"type": "round_start", "round_number": 1, "round_type": "initial"},
+        *events,
+        {"type": "round_complete", **rnd},
+        {"type": "debate_complete", "rounds": [rnd]},
+    ]
+
+
+async def _run(events: list[dict]) -> tuple[RecordingConsole, list]:
+    from llm_council.cli.runners import run_debate_streaming
+
+    async def fake_run_debate(query, execute_round, cycles):
+        for event in events:
+            yield event
+
+    recorder = RecordingConsole()
+    with (
+        patch("llm_council.cli.runners._run_debate", fake_run_debate),
+        patch("llm_council.cli.runners.console", recorder),
+        patch("llm_council.cli.runners.build_model_panel", side_effect=_panel_stub),
+    ):
+        rounds, _ = await run_debate_streaming("Test question")
+    return recorder, rounds
+
+
+def _start(model):
+    return {"type": "model_start", "model": model}
+
+
+def _token(model, text):
+    return {"type": "token", "model": model, "content": text}
+
+
+def _complete(model):
+    return {"type": "model_complete", "model": model, "response": {"model": model}}
+
+
+@pytest.mark.asyncio
+async def test_interleaved_models_are_printed_contiguously_in_start_order():
+    """Tokens arriving interleaved are shown one model at a time."""
+    alpha, beta, gamma = MODELS
+    events = _round(
+        [
+            _start(alpha),
+            _start(beta),
+            _start(gamma),
+            _token(alpha, "alpha-1 "),
+            _token(beta, "beta-1 "),
+            _token(gamma, "gamma-1 "),
+            _token(alpha, "alpha-2 "),
+            _token(beta, "beta-2 "),
+            # Buffered model finishes before the live one
+            _complete(beta),
+            # Error arrives while gamma is still buffered
+            {"type": "model_error", "model": gamma, "error": "boom"},
+            _complete(alpha),
+        ]
+    )
+
+    recorder, _ = await _run(events)
+
+    assert _owner_runs(recorder.items) == NAMES
+    assert "PANEL alpha: alpha-1 alpha-2 " in recorder.items
+    assert "PANEL beta: beta-1 beta-2 " in recorder.items
+    gamma_items = [item for item in recorder.items if _owner(item) == "gamma"]
+    assert any("gamma-1" in item for item in gamma_items)
+    assert any("Error: boom" in item for item in gamma_items)
+
+
+@pytest.mark.asyncio
+async def test_round_complete_flushes_models_without_terminal_events():
+    """
+    A live model that never sends model_complete/model_error must not strand
+    the buffered models behind it when the round ends.
+    """
+    alpha, beta, gamma = MODELS
+    events = _round(
+        [
+            _start(alpha),
+            _start(beta),
+            _start(gamma),
+            _token(alpha, "alpha-1 "),
+            _token(beta, "beta-1 "),
+            _token(gamma, "gamma-1 "),
+            _complete(gamma),
+            # alpha and beta end without a terminal event
+        ],
+        responses=[{"model": gamma, "response": "gamma-1 "}],
+    )
+
+    recorder, rounds = await _run(events)
+
+    assert _owner_runs(recorder.items) == NAMES
+    printed = "".join(recorder.items)
+    for token in ("alpha-1", "beta-1", "gamma-1"):
+        assert token in printed
+    assert "PANEL gamma: gamma-1 " in recorder.items
+    assert rounds[0]["responses"] == [{"model": gamma, "response": "gamma-1 "}]
+
+
+@pytest.mark.asyncio
+async def test_revised_answer_marker_is_shown_where_the_revision_starts():
+    """A defense's revised_answer_start is rendered in place, even when replayed."""
+    alpha, beta, _ = MODELS
+    events = _round(
+        [
+            _start(alpha),
+            _start(beta),
+            _token(beta, "beta-critiques "),
+            {"type": "revised_answer_start", "model": beta},
+            _token(beta, "beta-revised "),
+            _complete(beta),
+            _token(alpha, "alpha-1 "),
+            _complete(alpha),
+        ]
+    )
+
+    recorder, _ = await _run(events)
+
+    markers = [i for i, item in enumerate(recorder.items) if "Revised answer" in item]
+    assert len(markers) == 1
+
+    def printed_at(token):
+        return next(i for i, item in enumerate(recorder.items) if token in item)
+
+    assert printed_at("alpha-1") < printed_at("beta-critiques") < markers[0]
+    assert markers[0] < printed_at("beta-revised")
+
+
+@pytest.mark.asyncio
+async def test_each_round_starts_with_an_empty_buffer():
+    """Buffered output from one round is never replayed inside the next."""
+    alpha, beta, _ = MODELS
+    first = _round([_start(alpha), _start(beta), _token(beta, "beta-1 "), _complete(beta)])
+    second = [
+        {"type": "round_start", "round_number": 2, "round_type": "critique"},
+        _start(beta),
+        _token(beta, "beta-2 "),
+        _complete(beta),
+        {"type": "round_complete", "round_number": 2, "round_type": "critique", "responses": []},
+    ]
+    # Drop the first round's debate_complete so both rounds run
+    events = first[:-1] + second
+
+    recorder, rounds = await _run(events)
+
+    round_two = recorder.items.index(next(i for i in recorder.items if "ROUND 2" in i))
+    assert "PANEL beta: beta-1 " in recorder.items[:round_two]
+    assert recorder.items[round_two:].count("PANEL beta: beta-2 ") == 1
+    assert not any("beta-1" in item for item in recorder.items[round_two:])
+    assert [r["round_number"] for r in rounds] == [1, 2]
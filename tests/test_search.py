@@ -4,7 +4,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from llm_council.adapters.openrouter_client import query_model_with_tools
+from llm_council.adapters.openrouter_client import ModelResponse, query_model_with_tools
 from llm_council.adapters.tavily_search import SEARCH_TOOL, format_search_results, search_web
 from llm_council.engine import execute_tool
 
@@ -55,7 +55,7 @@ class TestSearchWeb:
 
                 mock_client_instance = AsyncMock()
                 mock_client_instance.post = AsyncMock(return_value=mock_response_obj)
-                mock_client.return_value.__aenter__.return_value = mock_client_instance
+                mock_client.return_value = mock_client_instance
 
                 result = await search_web("test query")
 
@@ -71,7 +71,7 @@ class TestSearchWeb:
             with patch("httpx.AsyncClient") as mock_client:
                 mock_client_instance = AsyncMock()
                 mock_client_instance.post = AsyncMock(side_effect=Exception("API Error"))
-                mock_client.return_value.__aenter__.return_value = mock_client_instance
+                mock_client.return_value = mock_client_instance
 
                 result = await search_web("test query")
 
@@ -79,6 +79,61 @@ class TestSearchWeb:
                 assert "API Error" in result["error"]
                 assert result["results"] == []
 
+    @pytest.mark.asyncio
+    async def test_search_web_shares_identical_queries(self):
+        """Concurrent searches that differ only in case/whitespace make one request."""
+        import asyncio
+
+        mock_response = {"answer": "", "results": []}
+
+        with patch("llm_council.adapters.tavily_search.TAVILY_API_KEY", "test-key"):
+            with patch("httpx.AsyncClient") as mock_client:
+                mock_response_obj = MagicMock()
+                mock_response_obj.json.return_value = mock_response
+                mock_response_obj.raise_for_status = MagicMock()
+
+                mock_client_instance = AsyncMock()
+                mock_client_instance.post = AsyncMock(return_value=mock_response_obj)
+                mock_client.return_value = mock_client_instance
+
+                results = await asyncio.gather(
+                    search_web("Bitcoin price"),
+                    search_web("  bitcoin   PRICE "),
+                    search_web("Bitcoin price"),
+                )
+
+                assert mock_client_instance.post.await_count == 1
+                assert results[0] == results[1] == results[2]
+
+    @pytest.mark.asyncio
+    async def test_search_cache_evicts_least_recently_used(self):
+        """Past the size cap, the least recently used query is searched again."""
+        mock_response = {"answer": "", "results": []}
+
+        with (
+            patch("llm_council.adapters.tavily_search.TAVILY_API_KEY", "test-key"),
+            patch("llm_council.adapters.tavily_search.SEARCH_CACHE_MAX_ENTRIES", 2),
+            patch("httpx.AsyncClient") as mock_client,
+        ):
+            mock_response_obj = MagicMock()
+            mock_response_obj.json.return_value = mock_response
+            mock_response_obj.raise_for_status = MagicMock()
+
+            mock_client_instance = AsyncMock()
+            mock_client_instance.post = AsyncMock(return_value=mock_response_obj)
+            mock_client.return_value = mock_client_instance
+
+            await search_web("a")
+            await search_web("b")
+            await search_web("a")  # Hit: "a" becomes most recently used
+            await search_web("c")  # Evicts "b"
+            assert mock_client_instance.post.await_count == 3
+
+            await search_web("a")
+            assert mock_client_instance.post.await_count == 3
+            await search_web("b")
+            assert mock_client_instance.post.await_count == 4
+
 
 class TestFormatSearchResults:
     """Tests for the format_search_results() function."""
@@ -130,7 +185,7 @@ class TestFormatSearchResults:
 
 
 class TestExecuteTool:
-    """Tests for the execute_tool() function in ranking.py."""
+    """Tests for the execute_tool() function in tools.py."""
 
     @pytest.mark.asyncio
     async def test_execute_search_web_tool(self):
@@ -140,7 +195,7 @@ class TestExecuteTool:
             "results": [{"title": "T", "url": "U", "content": "C"}],
         }
 
-        with patch("llm_council.engine.ranking.search_web", new_callable=AsyncMock) as mock_search:
+        with patch("llm_council.engine.tools.search_web", new_callable=AsyncMock) as mock_search:
             mock_search.return_value = mock_search_result
 
             result = await execute_tool("search_web", {"query": "test"})
@@ -170,7 +225,7 @@ class TestQueryModelWithTools:
 
             mock_client_instance = AsyncMock()
             mock_client_instance.post = AsyncMock(return_value=mock_response)
-            mock_client.return_value.__aenter__.return_value = mock_client_instance
+            mock_client.return_value = mock_client_instance
 
             result = await query_model_with_tools(
                 model="test/model",
@@ -179,8 +234,8 @@ class TestQueryModelWithTools:
                 tool_executor=AsyncMock(),
             )
 
-            assert result["content"] == "Direct answer without tools"
-            assert result["tool_calls_made"] == []
+            assert result.content == "Direct answer without tools"
+            assert result.tool_calls_made == []
 
     @pytest.mark.asyncio
     async def test_with_tool_call(self):
@@ -220,7 +275,7 @@ class TestQueryModelWithTools:
 
             mock_client_instance = AsyncMock()
             mock_client_instance.post = AsyncMock(side_effect=[mock_resp_1, mock_resp_2])
-            mock_client.return_value.__aenter__.return_value = mock_client_instance
+            mock_client.return_value = mock_client_instance
 
             mock_executor = AsyncMock(return_value="Search results here")
 
@@ -231,9 +286,9 @@ class TestQueryModelWithTools:
                 tool_executor=mock_executor,
             )
 
-            assert result["content"] == "Based on the search, the weather is sunny."
-            assert len(result["tool_calls_made"]) == 1
-            assert result["tool_calls_made"][0]["tool"] == "search_web"
+            assert result.content == "Based on the search, the weather is sunny."
+            assert len(result.tool_calls_made) == 1
+            assert result.tool_calls_made[0]["tool"] == "search_web"
             mock_executor.assert_called_once_with("search_web", {"query": "current weather"})
 
     @pytest.mark.asyncio
@@ -265,7 +320,7 @@ class TestQueryModelWithTools:
 
             mock_client_instance = AsyncMock()
             mock_client_instance.post = AsyncMock(return_value=mock_response)
-            mock_client.return_value.__aenter__.return_value = mock_client_instance
+            mock_client.return_value = mock_client_instance
 
             result = await query_model_with_tools(
                 model="test/model",
@@ -275,8 +330,8 @@ class TestQueryModelWithTools:
                 max_tool_calls=3,
             )
 
-            assert "Max tool calls reached" in result["content"]
-            assert len(result["tool_calls_made"]) == 3
+            assert "Max tool calls reached" in result.content
+            assert len(result.tool_calls_made) == 3
 
     @pytest.mark.asyncio
     async def test_tool_execution_error(self):
@@ -314,7 +369,7 @@ class TestQueryModelWithTools:
 
             mock_client_instance = AsyncMock()
             mock_client_instance.post = AsyncMock(side_effect=[mock_resp_1, mock_resp_2])
-            mock_client.return_value.__aenter__.return_value = mock_client_instance
+            mock_client.return_value = mock_client_instance
 
             # Tool executor that raises an error
             mock_executor = AsyncMock(side_effect=Exception("Tool failed"))
@@ -327,8 +382,8 @@ class TestQueryModelWithTools:
             )
 
             # Should still complete with the tool error captured
-            assert result["content"] == "I couldn't search but here's my answer."
-            assert "Error executing tool" in result["tool_calls_made"][0]["result_preview"]
+            assert result.content == "I couldn't search but here's my answer."
+            assert "Error executing tool" in result.tool_calls_made[0]["result_preview"]
 
 
 class TestStage1ToolIntegration:
@@ -339,12 +394,12 @@ class TestStage1ToolIntegration:
         """Stage 1 includes tool_calls_made in results when tools are used."""
         from llm_council.engine import stage1_collect_responses
 
-        mock_response = {
-            "content": "Here's what I found after searching...",
-            "tool_calls_made": [
+        mock_response = ModelResponse(
+            content="Here's what I found after searching...",
+            tool_calls_made=[
                 {"tool": "search_web", "args": {"query": "test"}, "result_preview": "..."}
             ],
-        }
+        )
 
         with patch(
             "llm_council.engine.ranking.query_model_with_tools", new_callable=AsyncMock
@@ -362,7 +417,7 @@ class TestStage1ToolIntegration:
         """Stage 1 omits tool_calls_made when no tools are used."""
         from llm_council.engine import stage1_collect_responses
 
-        mock_response = {"content": "I know this without searching.", "tool_calls_made": []}
+        mock_response = ModelResponse(content="I know this without searching.")
 
         with patch(
             "llm_council.engine.ranking.query_model_with_tools", new_callable=AsyncMock
@@ -395,3 +450,23 @@ class TestStage1ToolIntegration:
                 assert len(results) == 1
                 assert results[0]["model"] == "test/model"
                 assert "ReAct answer from test/model" in results[0]["response"]
+
+
+class TestSharedClient:
+    """Tests for the per-event-loop shared HTTP client."""
+
+    def test_reused_within_a_loop_and_replaced_across_loops(self):
+        import asyncio
+
+        from llm_council.adapters.http_client import close_shared_client, get_shared_client
+
+        async def session():
+            first = await get_shared_client()
+            assert await get_shared_client() is first
+            return first
+
+        client_a = asyncio.run(session())
+        client_b = asyncio.run(session())
+        assert client_a is not client_b
+
+        asyncio.run(close_shared_client())
@@ -10,6 +10,7 @@ from unittest.mock import patch
 
 import pytest
 
+from llm_council.adapters.openrouter_client import ModelResponse
 from tests.conftest import (
     SAMPLE_MODELS,
 )
@@ -19,6 +20,15 @@ DEBATE_QUERY_MODEL = "llm_council.engine.debate.query_model"
 DEBATE_QUERY_MODEL_WITH_TOOLS = "llm_council.engine.debate.query_model_with_tools"
 DEBATE_COUNCIL_MODELS = "llm_council.engine.debate.COUNCIL_MODELS"
 
+
+@pytest.fixture(autouse=True)
+def reset_model_latency():
+    """Clear observed model latencies so spawn order doesn't leak between tests."""
+    from llm_council.engine.debate import reset_model_latency
+
+    reset_model_latency()
+
+
 # =============================================================================
 # Test: Streaming round yields model completions as they finish
 # =============================================================================
@@ -45,7 +55,7 @@ async def test_debate_round_parallel_yields_as_completed():
             SAMPLE_MODELS[2]: 0.03,
         }
         await asyncio.sleep(delays.get(model, 0.01))
-        return {"content": f"Response from {model}"}
+        return ModelResponse(content=f"Response from {model}")
 
     with patch(DEBATE_QUERY_MODEL_WITH_TOOLS, side_effect=mock_query):
         with patch(DEBATE_COUNCIL_MODELS, SAMPLE_MODELS):
@@ -91,7 +101,7 @@ async def test_streaming_preserves_model_identity():
     }
 
     async def mock_query(model, messages, *args, **kwargs):
-        return {"content": expected_responses[model]}
+        return ModelResponse(content=expected_responses[model])
 
     with patch(DEBATE_QUERY_MODEL_WITH_TOOLS, side_effect=mock_query):
         with patch(DEBATE_COUNCIL_MODELS, SAMPLE_MODELS):
@@ -127,7 +137,7 @@ async def test_streaming_handles_model_failure():
     async def mock_query(model, messages, *args, **kwargs):
         if model == SAMPLE_MODELS[1]:
             return None  # Simulate failure
-        return {"content": f"Response from {model}"}
+        return ModelResponse(content=f"Response from {model}")
 
     with patch(DEBATE_QUERY_MODEL_WITH_TOOLS, side_effect=mock_query):
         with patch(DEBATE_COUNCIL_MODELS, SAMPLE_MODELS):
@@ -169,7 +179,7 @@ async def test_round_complete_contains_all_responses():
     from llm_council.engine import debate_round_parallel
 
     async def mock_query(model, messages, *args, **kwargs):
-        return {"content": f"Response from {model}"}
+        return ModelResponse(content=f"Response from {model}")
 
     with patch(DEBATE_QUERY_MODEL_WITH_TOOLS, side_effect=mock_query):
         with patch(DEBATE_COUNCIL_MODELS, SAMPLE_MODELS):
@@ -209,10 +219,10 @@ async def test_debate_streaming_event_order():
     from llm_council.engine.debate import debate_round_parallel, run_debate
 
     async def mock_query(model, messages, *args, **kwargs):
-        return {"content": f"Response from {model}"}
+        return ModelResponse(content=f"Response from {model}")
 
     async def mock_query_tools(model, messages, tools, tool_executor, *args, **kwargs):
-        return {"content": f"Response from {model}"}
+        return ModelResponse(content=f"Response from {model}")
 
     with patch(DEBATE_QUERY_MODEL, side_effect=mock_query):
         with patch(DEBATE_QUERY_MODEL_WITH_TOOLS, side_effect=mock_query_tools):
@@ -270,20 +280,20 @@ async def test_run_debate_produces_correct_rounds():
         # Return deterministic responses based on message content
         content = str(messages)
         if "critique" in content.lower() or "Critique" in content:
-            return {"content": f"Critique from {model}"}
+            return ModelResponse(content=f"Critique from {model}")
         elif "defense" in content.lower() or "Addressing" in content:
-            return {
-                "content": f"## Addressing Critiques\nDefense\n\n## Revised Response\nRevised from {model}"
-            }
-        return {"content": f"Initial response from {model}"}
+            return ModelResponse(
+                content=f"## Addressing Critiques\nDefense\n\n## Revised Response\nRevised from {model}"
+            )
+        return ModelResponse(content=f"Initial response from {model}")
 
     async def mock_query_tools(model, messages, tools, tool_executor, *args, **kwargs):
         content = str(messages)
         if "defense" in content.lower() or "Addressing" in content:
-            return {
-                "content": f"## Addressing Critiques\nDefense\n\n## Revised Response\nRevised from {model}"
-            }
-        return {"content": f"Initial response from {model}"}
+            return ModelResponse(
+                content=f"## Addressing Critiques\nDefense\n\n## Revised Response\nRevised from {model}"
+            )
+        return ModelResponse(content=f"Initial response from {model}")
 
     with patch(DEBATE_QUERY_MODEL, side_effect=mock_query):
         with patch(DEBATE_QUERY_MODEL_WITH_TOOLS, side_effect=mock_query_tools):
@@ -326,7 +336,7 @@ async def test_critique_round_streaming():
     from llm_council.engine import debate_round_parallel
 
     async def mock_query(model, messages, *args, **kwargs):
-        return {"content": f"## Critique of other model\nCritique from {model}"}
+        return ModelResponse(content=f"## Critique of other model\nCritique from {model}")
 
     initial_responses = [{"model": m, "response": f"Initial from {m}"} for m in SAMPLE_MODELS]
 
@@ -357,9 +367,9 @@ async def test_defense_round_streaming():
     from llm_council.engine import debate_round_parallel
 
     async def mock_query(model, messages, *args, **kwargs):
-        return {
-            "content": f"## Addressing Critiques\nDefense\n\n## Revised Response\nRevised from {model}"
-        }
+        return ModelResponse(
+            content=f"## Addressing Critiques\nDefense\n\n## Revised Response\nRevised from {model}"
+        )
 
     initial_responses = [{"model": m, "response": f"Initial from {m}"} for m in SAMPLE_MODELS]
     critique_responses = [
@@ -401,7 +411,7 @@ async def test_streaming_emits_model_start_events():
     from llm_council.engine import debate_round_parallel
 
     async def mock_query(model, messages, *args, **kwargs):
-        return {"content": f"Response from {model}"}
+        return ModelResponse(content=f"Response from {model}")
 
     with patch(DEBATE_QUERY_MODEL_WITH_TOOLS, side_effect=mock_query):
         with patch(DEBATE_COUNCIL_MODELS, SAMPLE_MODELS):
@@ -426,6 +436,38 @@ async def test_streaming_emits_model_start_events():
     )
 
 
+@pytest.mark.asyncio
+async def test_parallel_queries_start_while_model_start_events_are_consumed():
+    """
+    Verify that every model's request is already under way while the consumer
+    is still handling the first model_start event.
+    """
+    from llm_council.engine import debate_round_parallel
+
+    started = []
+
+    async def mock_query(model, messages, *args, **kwargs):
+        started.append(model)
+        return ModelResponse(content=f"Response from {model}")
+
+    with patch(DEBATE_QUERY_MODEL_WITH_TOOLS, side_effect=mock_query):
+        with patch(DEBATE_COUNCIL_MODELS, SAMPLE_MODELS):
+            events = debate_round_parallel(
+                round_type="initial",
+                user_query="Test question",
+                context={},
+            )
+            first = await anext(events)
+            assert first["type"] == "model_start"
+
+            # Simulate the consumer awaiting while rendering its spinner
+            for _ in range(5):
+                await asyncio.sleep(0)
+            assert sorted(started) == sorted(SAMPLE_MODELS)
+
+            await events.aclose()
+
+
 # =============================================================================
 # Test: Per-model timeout functionality
 # =============================================================================
@@ -442,8 +484,8 @@ async def test_streaming_handles_model_timeout():
         if model == SAMPLE_MODELS[0]:
             # This model will timeout
             await asyncio.sleep(10)
-            return {"content": "Should not reach this"}
-        return {"content": f"Response from {model}"}
+            return ModelResponse(content="Should not reach this")
+        return ModelResponse(content=f"Response from {model}")
 
     with patch(DEBATE_QUERY_MODEL_WITH_TOOLS, side_effect=mock_query):
         with patch(DEBATE_COUNCIL_MODELS, SAMPLE_MODELS):
@@ -467,6 +509,106 @@ async def test_streaming_handles_model_timeout():
     assert len(model_completes) == len(SAMPLE_MODELS) - 1
 
 
+@pytest.mark.asyncio
+async def test_streaming_cancels_stragglers_at_soft_deadline():
+    """
+    Verify that once enough models have answered, debate_round_parallel stops
+    waiting for stragglers at the soft deadline instead of the hard timeout.
+    """
+    from llm_council.engine import debate_round_parallel
+
+    async def mock_query(model, messages, *args, **kwargs):
+        if model == SAMPLE_MODELS[0]:
+            await asyncio.sleep(10)
+            return ModelResponse(content="Should not reach this")
+        return ModelResponse(content=f"Response from {model}")
+
+    with patch(DEBATE_QUERY_MODEL_WITH_TOOLS, side_effect=mock_query):
+        with patch(DEBATE_COUNCIL_MODELS, SAMPLE_MODELS):
+            events = []
+            async for event in debate_round_parallel(
+                round_type="initial",
+                user_query="Test question",
+                context={},
+                model_timeout=5.0,
+                min_responses=2,
+                soft_deadline=0.05,
+            ):
+                events.append(event)
+
+    model_errors = [e for e in events if e["type"] == "model_error"]
+    assert len(model_errors) == 1
+    assert model_errors[0]["model"] == SAMPLE_MODELS[0]
+    assert "soft deadline" in model_errors[0]["error"]
+
+    assert events[-1]["type"] == "round_complete"
+    assert len(events[-1]["responses"]) == len(SAMPLE_MODELS) - 1
+
+
+@pytest.mark.asyncio
+async def test_initial_round_waits_for_slow_model_until_model_timeout():
+    """
+    Verify that outside the defense round a slow model is not cancelled at
+    the soft deadline: its answer is waited for up to model_timeout.
+    """
+    from llm_council.engine import debate_round_parallel
+
+    async def mock_query(model, messages, *args, **kwargs):
+        if model == SAMPLE_MODELS[0]:
+            await asyncio.sleep(0.9)  # Past 80% of model_timeout, within model_timeout
+        return ModelResponse(content=f"Response from {model}")
+
+    with patch(DEBATE_QUERY_MODEL_WITH_TOOLS, side_effect=mock_query):
+        with patch(DEBATE_COUNCIL_MODELS, SAMPLE_MODELS):
+            events = [
+                event
+                async for event in debate_round_parallel(
+                    round_type="initial",
+                    user_query="Test question",
+                    context={},
+                    model_timeout=1.0,
+                )
+            ]
+
+    assert not [e for e in events if e["type"] == "model_error"]
+    assert [r["model"] for r in events[-1]["responses"]] == SAMPLE_MODELS
+
+
+@pytest.mark.asyncio
+async def test_defense_round_cancels_stragglers_by_default():
+    """
+    Verify that the defense round applies the soft deadline without it
+    being passed explicitly.
+    """
+    from llm_council.engine import debate_round_parallel
+
+    async def mock_query(model, messages, *args, **kwargs):
+        if model == SAMPLE_MODELS[0]:
+            await asyncio.sleep(10)
+        return ModelResponse(content=f"## Revised Response\nRevised from {model}")
+
+    context = {
+        "initial_responses": [{"model": m, "response": f"Initial from {m}"} for m in SAMPLE_MODELS],
+        "critique_responses": [],
+    }
+
+    with patch(DEBATE_QUERY_MODEL_WITH_TOOLS, side_effect=mock_query):
+        with patch(DEBATE_COUNCIL_MODELS, SAMPLE_MODELS):
+            events = [
+                event
+                async for event in debate_round_parallel(
+                    round_type="defense",
+                    user_query="Test question",
+                    context=context,
+                    model_timeout=0.25,
+                )
+            ]
+
+    model_errors = [e for e in events if e["type"] == "model_error"]
+    assert [e["model"] for e in model_errors] == [SAMPLE_MODELS[0]]
+    assert "soft deadline" in model_errors[0]["error"]
+
+
 # =============================================================================
 # Test: run_debate orchestrator event sequence
 # =============================================================================
@@ -481,10 +623,10 @@ async def test_run_debate_event_sequence():
     from llm_council.engine.debate import debate_round_parallel, run_debate
 
     async def mock_query(model, messages, *args, **kwargs):
-        return {"content": f"Response from {model}"}
+        return ModelResponse(content=f"Response from {model}")
 
     async def mock_query_tools(model, messages, tools, tool_executor, *args, **kwargs):
-        return {"content": f"Response from {model}"}
+        return ModelResponse(content=f"Response from {model}")
 
     with patch(DEBATE_QUERY_MODEL, side_effect=mock_query):
         with patch(DEBATE_QUERY_MODEL_WITH_TOOLS, side_effect=mock_query_tools):
@@ -545,12 +687,12 @@ async def test_run_debate_error_on_insufficient_models():
     async def mock_query(model, messages, *args, **kwargs):
         # Only one model succeeds
         if model == SAMPLE_MODELS[0]:
-            return {"content": f"Response from {model}"}
+            return ModelResponse(content=f"Response from {model}")
         return None
 
     async def mock_query_tools(model, messages, tools, tool_executor, *args, **kwargs):
         if model == SAMPLE_MODELS[0]:
-            return {"content": f"Response from {model}"}
+            return ModelResponse(content=f"Response from {model}")
         return None
 
     with patch(DEBATE_QUERY_MODEL, side_effect=mock_query):
@@ -630,6 +772,45 @@ async def test_debate_round_streaming_yields_tokens():
     assert len(round_completes[0]["responses"]) == len(SAMPLE_MODELS)
 
 
+@pytest.mark.asyncio
+async def test_debate_round_streaming_times_out_a_trickling_model():
+    """
+    Verify that a model still streaming at model_timeout is reported as a
+    model_error while the other models' answers complete the round.
+    """
+    from llm_council.engine.debate import debate_round_streaming
+
+    slow_model = SAMPLE_MODELS[1]
+
+    async def mock_streaming_with_tools(model, messages, tools, tool_executor, **kwargs):
+        if model == slow_model:
+            while True:  # Keeps sending tokens, never finishes
+                yield {"type": "token", "content": "."}
+                await asyncio.sleep(0.01)
+        yield {"type": "token", "content": "Done"}
+        yield {"type": "done", "content": "Done", "tool_calls_made": []}
+
+    with patch(DEBATE_QUERY_MODEL_STREAMING_WITH_TOOLS, side_effect=mock_streaming_with_tools):
+        with patch(DEBATE_COUNCIL_MODELS, SAMPLE_MODELS):
+            events = [
+                event
+                async for event in debate_round_streaming(
+                    round_type="initial",
+                    user_query="Test question",
+                    context={},
+                    model_timeout=0.1,
+                )
+            ]
+
+    errors = [e for e in events if e["type"] == "model_error"]
+    assert [e["model"] for e in errors] == [slow_model]
+    assert "Timeout" in errors[0]["error"]
+
+    responses = events[-1]["responses"]
+    assert events[-1]["type"] == "round_complete"
+    assert [r["model"] for r in responses] == [m for m in SAMPLE_MODELS if m != slow_model]
+
+
 # =============================================================================
 # Test: Multiple cycles produce correct round sequence
 # =============================================================================
@@ -644,10 +825,10 @@ async def test_multiple_cycles_produces_correct_rounds():
     from llm_council.engine.debate import debate_round_parallel, run_debate
 
     async def mock_query(model, messages, *args, **kwargs):
-        return {"content": f"Response from {model}"}
+        return ModelResponse(content=f"Response from {model}")
 
     async def mock_query_tools(model, messages, tools, tool_executor, *args, **kwargs):
-        return {"content": f"Response from {model}"}
+        return ModelResponse(content=f"Response from {model}")
 
     with patch(DEBATE_QUERY_MODEL, side_effect=mock_query):
         with patch(DEBATE_QUERY_MODEL_WITH_TOOLS, side_effect=mock_query_tools):
@@ -676,6 +857,54 @@ async def test_multiple_cycles_produces_correct_rounds():
     assert len(events[-1]["rounds"]) == 5
 
 
+@pytest.mark.asyncio
+async def test_failed_defense_round_keeps_latest_answers():
+    """
+    Verify that when every model fails a defense round, the next critique
+    round debates the previous defense's answers rather than the initial ones.
+    """
+    from llm_council.engine.debate import run_debate
+
+    contexts = {}
+
+    async def fake_round(*, round_type, user_query, context):
+        round_number = len(contexts) + 1
+        contexts[round_number] = context
+        if round_number == 5:
+            responses = []  # Every model failed its second defense
+        else:
+            responses = [{"model": m, "response": f"round {round_number}"} for m in SAMPLE_MODELS]
+        yield {"type": "round_complete", "responses": responses}
+
+    events = [e async for e in run_debate("Test question", fake_round, cycles=3)]
+
+    assert events[-1]["type"] == "debate_complete"
+    assert contexts[4]["initial_responses"][0]["response"] == "round 3"
+    assert contexts[6]["initial_responses"][0]["response"] == "round 3"
+
+
+@pytest.mark.asyncio
+async def test_empty_critique_round_ends_debate_before_defense():
+    """
+    Verify that a critique round with no responses ends the debate with an
+    error instead of running a defense round with nothing to defend.
+    """
+    from llm_council.engine.debate import run_debate
+
+    round_types = []
+
+    async def fake_round(*, round_type, user_query, context):
+        round_types.append(round_type)
+        responses = [] if round_type == "critique" else [{"model": m} for m in SAMPLE_MODELS]
+        yield {"type": "round_complete", "responses": responses}
+
+    events = [e async for e in run_debate("Test question", fake_round)]
+
+    assert round_types == ["initial", "critique"]
+    assert events[-1]["type"] == "error"
+    assert "critiques" in events[-1]["message"]
+
+
 # =============================================================================
 # Test: debate_round_parallel with react uses council_react_loop
 # =============================================================================
@@ -823,3 +1052,297 @@ async def test_streaming_error_prevents_model_complete():
     round_completes = [e for e in events if e["type"] == "round_complete"]
     assert len(round_completes) == 1
     assert len(round_completes[0]["responses"]) == 0
+
+
+# =============================================================================
+# Test: debate_round_streaming runs models concurrently
+# =============================================================================
+
+
+@pytest.mark.asyncio
+async def test_debate_round_streaming_runs_models_concurrently():
+    """
+    Verify that all models stream at once: the first model blocks until the last
+    one has produced a token, which would deadlock a sequential implementation.
+    """
+    from llm_council.engine.debate import debate_round_streaming
+
+    last_model_streaming = asyncio.Event()
+
+    async def mock_streaming_with_tools(model, messages, tools, tool_executor, **kwargs):
+        if model == SAMPLE_MODELS[0]:
+            await last_model_streaming.wait()
+        yield {"type": "token", "content": f"From {model}"}
+        if model == SAMPLE_MODELS[-1]:
+            last_model_streaming.set()
+        yield {"type": "done", "content": f"From {model}", "tool_calls_made": []}
+
+    async def collect():
+        return [
+            event
+            async for event in debate_round_streaming(
+                round_type="initial", user_query="Test question", context={}
+            )
+        ]
+
+    with patch(DEBATE_QUERY_MODEL_STREAMING_WITH_TOOLS, side_effect=mock_streaming_with_tools):
+        with patch(DEBATE_COUNCIL_MODELS, SAMPLE_MODELS):
+            events = await asyncio.wait_for(collect(), timeout=2.0)
+
+    # The blocked first model finishes last
+    completes = [e["model"] for e in events if e["type"] == "model_complete"]
+    assert completes[-1] == SAMPLE_MODELS[0]
+
+    # round_complete keeps council order regardless of finish order
+    round_complete = events[-1]
+    assert round_complete["type"] == "round_complete"
+    assert [r["model"] for r in round_complete["responses"]] == SAMPLE_MODELS
+
+
+# =============================================================================
+# Test: debate_round_parallel cancels in-flight models when closed early
+# =============================================================================
+
+
+@pytest.mark.asyncio
+async def test_debate_round_parallel_cancels_pending_models_on_close():
+    """
+    Verify that closing the round generator early cancels models still running,
+    instead of leaving their requests in flight.
+    """
+    from llm_council.engine.debate import debate_round_parallel
+
+    cancelled = []
+
+    async def mock_query(model, messages, *args, **kwargs):
+        if model != SAMPLE_MODELS[0]:
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append(model)
+                raise
+        return ModelResponse(content=f"Response from {model}")
+
+    with patch(DEBATE_QUERY_MODEL_WITH_TOOLS, side_effect=mock_query):
+        with patch(DEBATE_COUNCIL_MODELS, SAMPLE_MODELS):
+            round_events = debate_round_parallel(
+                round_type="initial", user_query="Test question", context={}
+            )
+            async for event in round_events:
+                if event["type"] == "model_complete":
+                    break
+            await round_events.aclose()
+            for _ in range(5):  # let the cancellations propagate
+                await asyncio.sleep(0)
+
+    assert sorted(cancelled) == sorted(SAMPLE_MODELS[1:])
+
+
+# =============================================================================
+# Test: debate_round_streaming coalesces token bursts
+# =============================================================================
+
+
+@pytest.mark.asyncio
+async def test_debate_round_streaming_coalesces_token_bursts():
+    """
+    Verify that a burst of tokens is emitted as a few batched events, with the
+    first token sent on its own and no text lost.
+    """
+    from llm_council.engine.debate import debate_round_streaming
+
+    pieces = [f"t{i} " for i in range(40)]
+
+    async def mock_streaming_with_tools(model, messages, tools, tool_executor, **kwargs):
+        for piece in pieces:
+            yield {"type": "token", "content": piece}
+        yield {"type": "done", "content": "".join(pieces), "tool_calls_made": []}
+
+    with patch(DEBATE_QUERY_MODEL_STREAMING_WITH_TOOLS, side_effect=mock_streaming_with_tools):
+        with patch(DEBATE_COUNCIL_MODELS, [SAMPLE_MODELS[0]]):
+            events = [
+                event
+                async for event in debate_round_streaming(
+                    round_type="initial", user_query="Test question", context={}
+                )
+            ]
+
+    token_events = [e for e in events if e["type"] == "token"]
+    assert token_events[0]["content"] == pieces[0]
+    assert len(token_events) < len(pieces)
+    assert "".join(e["content"] for e in token_events) == "".join(pieces)
+
+
+@pytest.mark.asyncio
+async def test_debate_round_streaming_tracks_revised_answer_incrementally():
+    """
+    Verify that a streamed defense flags where its revised answer starts, and
+    extracts it even when the header is split across tokens.
+    """
+    from llm_council.engine.debate import debate_round_streaming
+
+    pieces = ["## Addressing Critiques\nFair.\n\n## Rev", "ised Resp", "onse\nNew ", "answer."]
+
+    async def mock_streaming_with_tools(model, messages, tools, tool_executor, **kwargs):
+        for piece in pieces:
+            yield {"type": "token", "content": piece}
+        yield {"type": "done", "content": "".join(pieces), "tool_calls_made": []}
+
+    context = {
+        "initial_responses": [{"model": SAMPLE_MODELS[0], "response": "Initial"}],
+        "critique_responses": [{"model": SAMPLE_MODELS[1], "response": "Critique"}],
+    }
+    with patch(DEBATE_QUERY_MODEL_STREAMING_WITH_TOOLS, side_effect=mock_streaming_with_tools):
+        with patch(DEBATE_COUNCIL_MODELS, [SAMPLE_MODELS[0]]):
+            events = [
+                event
+                async for event in debate_round_streaming(
+                    round_type="defense", user_query="Test question", context=context
+                )
+            ]
+
+    types = [e["type"] for e in events]
+    assert types.count("revised_answer_start") == 1
+    assert types.index("revised_answer_start") < types.index("model_complete")
+    complete = next(e for e in events if e["type"] == "model_complete")
+    assert complete["response"]["revised_answer"] == "New answer."
+
+
+@pytest.mark.asyncio
+async def test_buffered_tokens_are_flushed_while_the_model_stalls():
+    """
+    Verify that tokens held by the coalescer are emitted within its window
+    even when the upstream goes quiet, not when the next event arrives.
+    """
+    import time
+
+    from llm_council.engine.debate import debate_round_streaming
+
+    async def mock_streaming_with_tools(model, messages, tools, tool_executor, **kwargs):
+        yield {"type": "token", "content": "First"}
+        yield {"type": "token", "content": " second"}  # Buffered behind the first
+        await asyncio.sleep(0.5)  # Stall, e.g. before a tool call
+        yield {"type": "done", "content": "First second", "tool_calls_made": []}
+
+    started = time.monotonic()
+    arrivals = []
+    with patch(DEBATE_QUERY_MODEL_STREAMING_WITH_TOOLS, side_effect=mock_streaming_with_tools):
+        with patch(DEBATE_COUNCIL_MODELS, [SAMPLE_MODELS[0]]):
+            async for event in debate_round_streaming(
+                round_type="initial", user_query="Test question", context={}
+            ):
+                if event["type"] == "token":
+                    arrivals.append((event["content"], time.monotonic() - started))
+
+    assert [content for content, _ in arrivals] == ["First", " second"]
+    assert arrivals[1][1] < 0.1  # ~25ms window, well before the stall ends
+
+
+def test_streaming_path_never_sleeps_with_a_delay():
+    """
+    Guard against pacing the token stream with a fixed sleep: only zero-delay
+    asyncio.sleep(0) yields are allowed in the streaming code path.
+    """
+    import inspect
+    import re
+
+    from llm_council.engine import debate, streaming
+
+    for obj in (
+        streaming.TokenCoalescer,
+        streaming.stream_in_background,
+        debate._ModelAccumulator,
+        debate._stream_model,
+        debate.debate_round_streaming,
+    ):
+        source = inspect.getsource(obj)
+        assert not re.search(r"\bsleep\((?!0\))", source), obj.__name__
+
+
+def test_unmeasured_models_spawn_first():
+    """
+    Verify that a model with no latency measurement yet is launched before
+    the measured ones in both orders, instead of sorting as the fastest.
+    """
+    from llm_council.engine import debate
+
+    with patch(DEBATE_COUNCIL_MODELS, SAMPLE_MODELS):
+        debate._record_latency(SAMPLE_MODELS[0], 2.0)
+        debate._record_latency(SAMPLE_MODELS[1], 1.0)
+
+        assert debate._models_by_latency(slowest_first=True) == [
+            SAMPLE_MODELS[2],
+            SAMPLE_MODELS[0],
+            SAMPLE_MODELS[1],
+        ]
+        assert debate._models_by_latency(slowest_first=False) == [
+            SAMPLE_MODELS[2],
+            SAMPLE_MODELS[1],
+            SAMPLE_MODELS[0],
+        ]
+
+
+@pytest.mark.asyncio
+async def test_spawn_order_follows_observed_latency():
+    """
+    Verify that after a round, parallel mode launches the slowest model first
+    and streaming starts the fastest first, keeping council order in results.
+    """
+    from llm_council.engine.debate import debate_round_parallel, debate_round_streaming
+
+    delays = {SAMPLE_MODELS[0]: 0.03, SAMPLE_MODELS[1]: 0.0, SAMPLE_MODELS[2]: 0.015}
+    launched = []
+
+    async def mock_query(model, messages, *args, **kwargs):
+        launched.append(model)
+        await asyncio.sleep(delays[model])
+        return ModelResponse(content=f"Response from {model}")
+
+    async def mock_streaming_with_tools(model, messages, tools, tool_executor, **kwargs):
+        launched.append(model)
+        yield {"type": "token", "content": "x"}
+        yield {"type": "done", "content": "x", "tool_calls_made": []}
+
+    with patch(DEBATE_COUNCIL_MODELS, SAMPLE_MODELS):
+        with patch(DEBATE_QUERY_MODEL_WITH_TOOLS, side_effect=mock_query):
+            async for _ in debate_round_parallel("initial", "Q", {}):
+                pass
+            launched.clear()
+            events = [e async for e in debate_round_parallel("initial", "Q", {})]
+        assert launched == [SAMPLE_MODELS[0], SAMPLE_MODELS[2], SAMPLE_MODELS[1]]
+        assert [r["model"] for r in events[-1]["responses"]] == SAMPLE_MODELS
+
+        launched.clear()
+        with patch(DEBATE_QUERY_MODEL_STREAMING_WITH_TOOLS, side_effect=mock_streaming_with_tools):
+            streamed = [e async for e in debate_round_streaming("initial", "Q", {})]
+        assert launched[0] == SAMPLE_MODELS[1]
+        assert [r["model"] for r in streamed[-1]["responses"]] == SAMPLE_MODELS
+
+
+@pytest.mark.asyncio
+async def test_parallel_round_caps_requests_per_provider():
+    """
+    Verify that models sharing a provider prefix respect the per-provider cap
+    while other providers run alongside them.
+    """
+    from llm_council.engine.debate import debate_round_parallel
+
+    models = ["acme/a", "acme/b", "acme/c", "other/x"]
+    in_flight = {"acme": 0, "other": 0}
+    peak = {"acme": 0, "other": 0}
+
+    async def mock_query(model, messages, *args, **kwargs):
+        provider = model.split("/")[0]
+        in_flight[provider] += 1
+        peak[provider] = max(peak[provider], in_flight[provider])
+        await asyncio.sleep(0.01)
+        in_flight[provider] -= 1
+        return ModelResponse(content=f"Response from {model}")
+
+    with patch(DEBATE_QUERY_MODEL_WITH_TOOLS, side_effect=mock_query):
+        with patch(DEBATE_COUNCIL_MODELS, models):
+            with patch("llm_council.engine.debate.MAX_CONCURRENT_PER_PROVIDER", 2):
+                events = [e async for e in debate_round_parallel("initial", "Q", {})]
+
+    assert peak == {"acme": 2, "other": 1}
+    assert len(events[-1]["responses"]) == len(models)